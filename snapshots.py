@@ -18,11 +18,25 @@ import configparser
 import json
 import time
 import argparse
+import codecs
+import functools
 import fcntl
 import re
+import stat
 import requests
-from dataclasses import dataclass
-from typing import List, Optional
+from urllib3.util.retry import Retry
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, fields
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Optional faster JSON parser (falls back to the standard library if not installed)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Get project directory (where this script is located)
 PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -30,101 +44,146 @@ PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
 # Configuration file path (relative to project directory)
 CONFIG_FILE = os.path.join(PROJECT_DIR, "snapshots.config")
 
-def load_config() -> configparser.ConfigParser:
-    """Load configuration from INI file with defaults."""
-    config = configparser.ConfigParser()
-    
-    # Set defaults
-    defaults = {
-        'DIRECTORIES': {
-            'configs_dir': 'configs',
-            'logs_dir': 'logs'
-        },
-        'FILES': {
-            'log_file': 'snapshots.log',
-            'lock_file': 'snapshots.lock'
-        },
-        'TIMING': {
-            'delay_between_servers': '5',
-            'snapshot_creation_timeout': '900'  # 15 minutes in seconds
-        },
-        'LOGGING': {
-            'max_bytes': '5242880',
-            'backup_count': '5',
-            'level': 'DEBUG'
-        },
-        'TELEGRAM': {
-            'enabled': 'true',
-            'bot_token': '',
-            'chat_id': '',
-            'timeout': '10',
-            'retries': '3',
-            'base_delay_between_retries': '2',
-            'message_success': '*Snapshot Success*\\nServer: `{server_name}`\\nSnapshot: `{snapshot_name}`\\nTotal: `{total_snapshots}` snapshots',
-            'message_failure': '*Snapshot Failed*\\nServer: `{server_name}`\\nError occurred during snapshot creation'
-        },
-        'WEBHOOK': {
-            'enabled': 'false',
-            'url': '',
-            'timeout': '10',
-            'retries': '3',
-            'base_delay_between_retries': '2',
-            'payload_success': '{"script": "{script}", "provider": "{provider}", "server": "{server_name}", "server_id": "{server_id}", "status": "{status}", "hostname": "{hostname}", "timestamp": "{timestamp}", "snapshot_name": "{snapshot_name}", "total_snapshots": "{total_snapshots}", "snapshot_info": "{snapshot_info}"}',
-            'payload_failure': '{"script": "{script}", "provider": "{provider}", "server": "{server_name}", "server_id": "{server_id}", "status": "{status}", "hostname": "{hostname}", "timestamp": "{timestamp}", "snapshot_name": "{snapshot_name}", "total_snapshots": "{total_snapshots}", "snapshot_info": "{snapshot_info}"}'
-        }
+# Built-in defaults (section -> option -> raw string value), overridden by snapshots.config
+_DEFAULTS = {
+    'DIRECTORIES': {
+        'configs_dir': 'configs',
+        'logs_dir': 'logs'
+    },
+    'FILES': {
+        'log_file': 'snapshots.log',
+        'lock_file': 'snapshots.lock',
+        'config_cache_file': ''  # Empty = no cache
+    },
+    'TIMING': {
+        'delay_between_servers': '5',
+        'snapshot_creation_timeout': '900',  # 15 minutes in seconds
+        'max_parallel_servers': '1',  # 1 = process servers one after another
+        'max_parallel_per_provider': '0'  # 0 = only max_parallel_servers applies
+    },
+    'LOGGING': {
+        'max_bytes': '5242880',
+        'backup_count': '5',
+        'level': 'DEBUG'
+    },
+    'TELEGRAM': {
+        'enabled': 'true',
+        'bot_token': '',
+        'chat_id': '',
+        'timeout': '10',
+        'retries': '3',
+        'base_delay_between_retries': '2',
+        'message_success': '*Snapshot Success*\\nServer: `{server_name}`\\nSnapshot: `{snapshot_name}`\\nTotal: `{total_snapshots}` snapshots',
+        'message_failure': '*Snapshot Failed*\\nServer: `{server_name}`\\nError occurred during snapshot creation'
+    },
+    'WEBHOOK': {
+        'enabled': 'false',
+        'url': '',
+        'timeout': '10',
+        'retries': '3',
+        'base_delay_between_retries': '2',
+        'payload_success': '{"script": "{script}", "provider": "{provider}", "server": "{server_name}", "server_id": "{server_id}", "status": "{status}", "hostname": "{hostname}", "timestamp": "{timestamp}", "snapshot_name": "{snapshot_name}", "total_snapshots": "{total_snapshots}", "snapshot_info": "{snapshot_info}"}',
+        'payload_failure': '{"script": "{script}", "provider": "{provider}", "server": "{server_name}", "server_id": "{server_id}", "status": "{status}", "hostname": "{hostname}", "timestamp": "{timestamp}", "snapshot_name": "{snapshot_name}", "total_snapshots": "{total_snapshots}", "snapshot_info": "{snapshot_info}"}'
     }
+}
+
+def load_config() -> Dict[str, Dict[str, str]]:
+    """
+    Load configuration from INI file with defaults.
+    Returns a plain dict of sections -> options (raw string values).
+    ConfigParser is only used when a config file actually exists.
+    """
+    if not os.path.exists(CONFIG_FILE):
+        return {section: dict(options) for section, options in _DEFAULTS.items()}
     
-    # Set defaults first
-    for section, options in defaults.items():
-        config.add_section(section)
-        for key, value in options.items():
-            config.set(section, key, value)
-    
-    # Load from file if it exists
-    if os.path.exists(CONFIG_FILE):
-        try:
-            config.read(CONFIG_FILE)
-        except Exception as e:
-            print(f"WARNING: Failed to load config file '{CONFIG_FILE}': {e}. Using defaults.", file=sys.stderr)
+    config = configparser.ConfigParser()
+    config.read_dict(_DEFAULTS)
+    try:
+        config.read(CONFIG_FILE)
+    except Exception as e:
+        print(f"WARNING: Failed to load config file '{CONFIG_FILE}': {e}. Using defaults.", file=sys.stderr)
     
-    return config
+    # Walk all sections once into plain dicts so constants below are plain dict lookups
+    return {section: dict(config.items(section)) for section in config.sections()}
 
 # Load configuration
-_CONFIG = load_config()
+_CFG = load_config()
+
+def _cfg_get(section: str, key: str, fallback: str = '') -> str:
+    """Get a raw config value from the flattened config."""
+    return _CFG.get(section, {}).get(key, fallback)
+
+def _cfg_getint(section: str, key: str, fallback: int) -> int:
+    """Get an integer config value from the flattened config."""
+    value = _CFG.get(section, {}).get(key)
+    return fallback if value is None else int(value)
+
+def _cfg_getboolean(section: str, key: str, fallback: bool) -> bool:
+    """Get a boolean config value (same accepted values as ConfigParser.getboolean)."""
+    value = _CFG.get(section, {}).get(key)
+    if value is None:
+        return fallback
+    if value.lower() not in configparser.ConfigParser.BOOLEAN_STATES:
+        raise ValueError(f"Not a boolean: {value}")
+    return configparser.ConfigParser.BOOLEAN_STATES[value.lower()]
 
 # Constants (loaded from config, all paths relative to project directory)
-CONFIGS_DIR = os.path.join(PROJECT_DIR, _CONFIG.get('DIRECTORIES', 'configs_dir', fallback='configs'))
-LOGS_DIR = os.path.join(PROJECT_DIR, _CONFIG.get('DIRECTORIES', 'logs_dir', fallback='logs'))
+CONFIGS_DIR = os.path.join(PROJECT_DIR, _cfg_get('DIRECTORIES', 'configs_dir', fallback='configs'))
+LOGS_DIR = os.path.join(PROJECT_DIR, _cfg_get('DIRECTORIES', 'logs_dir', fallback='logs'))
+CONFIGS_DIR_SLASH = CONFIGS_DIR + os.sep  # Prefix for plain config file names (see load_configs)
 DEFAULT_CONFIG_FILE = os.path.join(CONFIGS_DIR, "config.json")
-LOG_FILE = os.path.join(LOGS_DIR, _CONFIG.get('FILES', 'log_file', fallback='snapshots.log'))
-LOCK_FILE = os.path.join(LOGS_DIR, _CONFIG.get('FILES', 'lock_file', fallback='snapshots.lock'))
-DELAY_BETWEEN_SERVERS = _CONFIG.getint('TIMING', 'delay_between_servers', fallback=20)
-SNAPSHOT_CREATION_TIMEOUT = _CONFIG.getint('TIMING', 'snapshot_creation_timeout', fallback=900)  # 15 minutes default
-LOG_MAX_BYTES = _CONFIG.getint('LOGGING', 'max_bytes', fallback=5242880)
-LOG_BACKUP_COUNT = _CONFIG.getint('LOGGING', 'backup_count', fallback=5)
-LOG_LEVEL = getattr(logging, _CONFIG.get('LOGGING', 'level', fallback='DEBUG').upper(), logging.DEBUG)
+LOG_FILE = os.path.join(LOGS_DIR, _cfg_get('FILES', 'log_file', fallback='snapshots.log'))
+LOCK_FILE = os.path.join(LOGS_DIR, _cfg_get('FILES', 'lock_file', fallback='snapshots.lock'))
+_CONFIG_CACHE_NAME = _cfg_get('FILES', 'config_cache_file', fallback='').strip()
+CONFIG_CACHE_FILE = os.path.join(LOGS_DIR, _CONFIG_CACHE_NAME) if _CONFIG_CACHE_NAME else None  # Empty = no cache
+DELAY_BETWEEN_SERVERS = _cfg_getint('TIMING', 'delay_between_servers', fallback=20)
+SNAPSHOT_CREATION_TIMEOUT = _cfg_getint('TIMING', 'snapshot_creation_timeout', fallback=900)  # 15 minutes default
+MAX_PARALLEL_SERVERS = max(1, _cfg_getint('TIMING', 'max_parallel_servers', fallback=1))
+MAX_PARALLEL_PER_PROVIDER = max(0, _cfg_getint('TIMING', 'max_parallel_per_provider', fallback=0))  # 0 = no per-provider limit
+MAX_CONFIG_FILE_SIZE = 1024 * 1024  # Server JSON configs larger than 1 MB are rejected without parsing
+LOG_MAX_BYTES = _cfg_getint('LOGGING', 'max_bytes', fallback=5242880)
+LOG_BACKUP_COUNT = _cfg_getint('LOGGING', 'backup_count', fallback=5)
+LOG_LEVEL = getattr(logging, _cfg_get('LOGGING', 'level', fallback='DEBUG').upper(), logging.DEBUG)
 
 # Telegram configuration (global fallback - used when not set in server JSON files)
-TELEGRAM_ENABLED = _CONFIG.getboolean('TELEGRAM', 'enabled', fallback=True)
-TELEGRAM_BOT_TOKEN = _CONFIG.get('TELEGRAM', 'bot_token', fallback='').strip() or None
-TELEGRAM_CHAT_ID = _CONFIG.get('TELEGRAM', 'chat_id', fallback='').strip() or None
-TELEGRAM_TIMEOUT = _CONFIG.getint('TELEGRAM', 'timeout', fallback=10)
-TELEGRAM_RETRIES = _CONFIG.getint('TELEGRAM', 'retries', fallback=3)
-TELEGRAM_BASE_DELAY_BETWEEN_RETRIES = _CONFIG.getint('TELEGRAM', 'base_delay_between_retries', fallback=2)
+TELEGRAM_ENABLED = _cfg_getboolean('TELEGRAM', 'enabled', fallback=True)
+TELEGRAM_BOT_TOKEN = _cfg_get('TELEGRAM', 'bot_token', fallback='').strip() or None
+TELEGRAM_CHAT_ID = _cfg_get('TELEGRAM', 'chat_id', fallback='').strip() or None
+TELEGRAM_TIMEOUT = _cfg_getint('TELEGRAM', 'timeout', fallback=10)
+TELEGRAM_RETRIES = _cfg_getint('TELEGRAM', 'retries', fallback=3)
+TELEGRAM_BASE_DELAY_BETWEEN_RETRIES = _cfg_getint('TELEGRAM', 'base_delay_between_retries', fallback=2)
+
+def _ts() -> str:
+    """Current local time as used in log/status lines and stderr messages."""
+    return datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+# Backslash escape sequences understood by decode_config_string (same set as Python string literals)
+_ESCAPE_SEQUENCE_RE = re.compile(r'\\(?:[\\\'"abfnrtv]|[0-7]{1,3}|x[0-9A-Fa-f]{2}|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|N\{[^}]+\})')
+
+def _decode_escape(match) -> str:
+    """re.sub callback: decode a single escape sequence."""
+    return codecs.decode(match.group(0), 'unicode_escape')
 
 # Helper function to decode escape sequences in config strings
 def decode_config_string(s: str) -> str:
-    """Decode escape sequences like \\n to actual newlines."""
-    if not s:
+    """
+    Decode escape sequences like \\n to actual newlines.
+    Only the escape sequences themselves are decoded, so other (non-ASCII) text is kept as-is.
+    """
+    if not s or '\\' not in s:
         return s
-    return s.encode().decode('unicode_escape')
+    return _ESCAPE_SEQUENCE_RE.sub(_decode_escape, s)
+
+TELEGRAM_MESSAGE_SUCCESS = decode_config_string(_cfg_get('TELEGRAM', 'message_success', fallback='').strip()) or None
+TELEGRAM_MESSAGE_FAILURE = decode_config_string(_cfg_get('TELEGRAM', 'message_failure', fallback='').strip()) or None
 
-TELEGRAM_MESSAGE_SUCCESS = decode_config_string(_CONFIG.get('TELEGRAM', 'message_success', fallback='').strip()) or None
-TELEGRAM_MESSAGE_FAILURE = decode_config_string(_CONFIG.get('TELEGRAM', 'message_failure', fallback='').strip()) or None
+def _telegram_api_url(bot_token: str) -> str:
+    """Build the Telegram sendMessage URL for a bot token."""
+    return f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
 # Set Telegram API URL if credentials are available
 if TELEGRAM_ENABLED and TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
-    TELEGRAM_API_URL = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+    TELEGRAM_API_URL = _telegram_api_url(TELEGRAM_BOT_TOKEN)
 else:
     TELEGRAM_API_URL = None
     if TELEGRAM_ENABLED:
@@ -132,86 +191,117 @@ else:
         pass  # Will be checked later when actually trying to send
 
 # Webhook configuration (global fallback)
-WEBHOOK_ENABLED = _CONFIG.getboolean('WEBHOOK', 'enabled', fallback=False)
-WEBHOOK_URL = _CONFIG.get('WEBHOOK', 'url', fallback='').strip() or None
-WEBHOOK_TIMEOUT = _CONFIG.getint('WEBHOOK', 'timeout', fallback=10)
-WEBHOOK_RETRIES = _CONFIG.getint('WEBHOOK', 'retries', fallback=3)
-WEBHOOK_BASE_DELAY_BETWEEN_RETRIES = _CONFIG.getint('WEBHOOK', 'base_delay_between_retries', fallback=2)
-WEBHOOK_PAYLOAD_SUCCESS = _CONFIG.get('WEBHOOK', 'payload_success', fallback='').strip() or None
-WEBHOOK_PAYLOAD_FAILURE = _CONFIG.get('WEBHOOK', 'payload_failure', fallback='').strip() or None
-
-def sanitize_log_output(text: str, api_token: str = None) -> str:
-    """
-    Remove credentials and sensitive information from log output.
-    Masks API tokens, passwords, and other sensitive patterns.
-    """
-    if not text:
-        return text
-    
-    # Mask API tokens (DigitalOcean tokens are typically long alphanumeric strings)
-    if api_token:
-        text = text.replace(api_token, api_token[:6] + '...' + api_token[-6:] if len(api_token) > 12 else '***')
-    
-    # Mask common token patterns (long alphanumeric strings that might be tokens)
-    # Pattern for potential tokens: long alphanumeric strings (20+ chars)
-    token_pattern = r'\b([A-Za-z0-9]{20,})\b'
-    def mask_token(match):
-        token = match.group(1)
-        # Don't mask if it looks like a snapshot ID or droplet ID (usually shorter)
-        if len(token) < 20:
-            return token
-        return token[:6] + '...' + token[-6:]
-    
-    text = re.sub(token_pattern, mask_token, text)
-    
-    # Mask common credential patterns
-    credential_patterns = [
+WEBHOOK_ENABLED = _cfg_getboolean('WEBHOOK', 'enabled', fallback=False)
+WEBHOOK_URL = _cfg_get('WEBHOOK', 'url', fallback='').strip() or None
+WEBHOOK_TIMEOUT = _cfg_getint('WEBHOOK', 'timeout', fallback=10)
+WEBHOOK_RETRIES = _cfg_getint('WEBHOOK', 'retries', fallback=3)
+WEBHOOK_BASE_DELAY_BETWEEN_RETRIES = _cfg_getint('WEBHOOK', 'base_delay_between_retries', fallback=2)
+WEBHOOK_PAYLOAD_SUCCESS = _cfg_get('WEBHOOK', 'payload_success', fallback='').strip() or None
+WEBHOOK_PAYLOAD_FAILURE = _cfg_get('WEBHOOK', 'payload_failure', fallback='').strip() or None
+
+def _parse_payload_template(raw: Optional[str]):
+    """Parse a fallback webhook payload template from the config. Returns (payload dict or None, error or None)."""
+    if not raw:
+        return None, None
+    try:
+        payload = json.loads(raw)
+    except json.JSONDecodeError as e:
+        return None, e
+    if not isinstance(payload, dict):
+        return None, ValueError("not a JSON object")
+    return payload, None
+
+# Fallback payload templates are parsed once here instead of for every notification
+_WEBHOOK_PAYLOAD_SUCCESS_OBJ, _WEBHOOK_PAYLOAD_SUCCESS_ERROR = _parse_payload_template(WEBHOOK_PAYLOAD_SUCCESS)
+_WEBHOOK_PAYLOAD_FAILURE_OBJ, _WEBHOOK_PAYLOAD_FAILURE_ERROR = _parse_payload_template(WEBHOOK_PAYLOAD_FAILURE)
+
+# Potential tokens: long alphanumeric strings (Telegram bot tokens may also contain '_' and '-')
+_TOKEN_RE = re.compile(r'\b[A-Za-z0-9]{20,}\b')
+_TELEGRAM_TOKEN_RE = re.compile(r'\b[A-Za-z0-9_-]{20,}\b')
+# Minimum length of a character run to be treated as a potential token
+_MIN_TOKEN_LENGTH = 20
+# Length of the shortest text a credential pattern can match (e.g. 'password=x')
+_MIN_CREDENTIAL_LENGTH = 10
+
+# Common credential patterns in JSON/text responses (compiled once at import time)
+_CREDENTIAL_RES = [
+    (re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in [
         (r'api[_-]?token["\']?\s*[:=]\s*["\']?([A-Za-z0-9_-]{10,})["\']?', r'api_token="***"'),
         (r'bot[_-]?token["\']?\s*[:=]\s*["\']?([A-Za-z0-9_-]{10,})["\']?', r'bot_token="***"'),
         (r'password["\']?\s*[:=]\s*["\']?([^\s"\']+)["\']?', r'password="***"'),
         (r'secret["\']?\s*[:=]\s*["\']?([A-Za-z0-9_-]{10,})["\']?', r'secret="***"'),
     ]
-    
-    for pattern, replacement in credential_patterns:
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-    
-    return text
+]
 
-def sanitize_telegram_output(text: str, token: str = None) -> str:
+def _mask_match(match) -> str:
+    """re.sub callback: mask a matched token-like string, keeping only its first and last 6 chars."""
+    token = match.group(0)
+    return token[:6] + '...' + token[-6:]
+
+def _mask_token(token: str) -> str:
+    """Return the masked form of a secret for logging (first and last 6 chars, or '***' if short)."""
+    return token[:6] + '...' + token[-6:] if len(token) > 12 else '***'
+
+def _sanitize(text: str, token: str = None, wide: bool = False, masked_token: str = None) -> str:
     """
-    Remove credentials and sensitive information from Telegram log output.
-    Masks Telegram bot tokens and other sensitive patterns.
+    Shared implementation of sanitize_log_output/sanitize_telegram_output.
+    Masks the explicit token (if given), token-like strings and credential patterns.
+    wide=True also treats '_' and '-' as token characters (Telegram bot tokens).
+    masked_token is the precomputed _mask_token(token), if the caller has it.
     """
     if not text:
         return text
     
-    # Mask Telegram bot token if provided
+    # Mask the explicitly known token (API token or bot token)
     if token:
-        text = text.replace(token, token[:6] + '...' + token[-6:] if len(token) > 12 else '***')
+        text = text.replace(token, masked_token or _mask_token(token))
     
-    # Mask common token patterns
-    token_pattern = r'\b([A-Za-z0-9_-]{20,})\b'
-    def mask_token(match):
-        token_str = match.group(1)
-        if len(token_str) < 20:
-            return token_str
-        return token_str[:6] + '...' + token_str[-6:]
+    # Short strings (e.g. "OK") can't contain a token-like string or a credential pattern
+    if len(text) < _MIN_CREDENTIAL_LENGTH:
+        return text
     
-    text = re.sub(token_pattern, mask_token, text)
+    # Mask common token patterns (long strings that might be tokens)
+    if len(text) >= _MIN_TOKEN_LENGTH:
+        text = (_TELEGRAM_TOKEN_RE if wide else _TOKEN_RE).sub(_mask_match, text)
     
     # Mask common credential patterns in JSON/text responses
-    credential_patterns = [
-        (r'bot[_-]?token["\']?\s*[:=]\s*["\']?([A-Za-z0-9_-]{10,})["\']?', r'bot_token="***"'),
-        (r'api[_-]?token["\']?\s*[:=]\s*["\']?([A-Za-z0-9_-]{10,})["\']?', r'api_token="***"'),
-        (r'password["\']?\s*[:=]\s*["\']?([^\s"\']+)["\']?', r'password="***"'),
-        (r'secret["\']?\s*[:=]\s*["\']?([A-Za-z0-9_-]{10,})["\']?', r'secret="***"'),
-    ]
-    
-    for pattern, replacement in credential_patterns:
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    for pattern, replacement in _CREDENTIAL_RES:
+        text = pattern.sub(replacement, text)
     
     return text
 
+def sanitize_log_output(text: str, api_token: str = None, masked_token: str = None) -> str:
+    """
+    Remove credentials and sensitive information from log output.
+    Masks API tokens, passwords, and other sensitive patterns.
+    Pass masked_token (e.g. ServerConfig.masked_api_token) to reuse a precomputed mask.
+    """
+    return _sanitize(text, api_token, masked_token=masked_token)
+
+def sanitize_telegram_output(text: str, token: str = None) -> str:
+    """
+    Remove credentials and sensitive information from Telegram log output.
+    Masks Telegram bot tokens and other sensitive patterns.
+    """
+    return _sanitize(text, token, wide=True)
+
+class _LazySanitize:
+    """
+    Defer sanitization until a log record is actually emitted.
+    Pass as a %s argument to a logger call; the sanitizer only runs if the record passes the level check.
+    """
+    __slots__ = ('sanitizer', 'args', 'result')
+
+    def __init__(self, sanitizer, *args):
+        self.sanitizer = sanitizer
+        self.args = args
+        self.result = None
+
+    def __str__(self) -> str:
+        if self.result is None:
+            self.result = self.sanitizer(*self.args)
+        return self.result
+
 def create_notification_data(script_name: str, server_name: str, server_id: str, status: str, 
                              hostname: str, timestamp: str, snapshot_name: str, total_snapshots: int,
                              provider: str = "unknown") -> dict:
@@ -232,24 +322,25 @@ def create_notification_data(script_name: str, server_name: str, server_id: str,
         "snapshot_info": f"{total_snapshots} snapshots exist"
     }
 
+# Default Telegram message layout (used when no custom message template is configured)
+_TG_MSG_TEMPLATE = (
+    "*FINAL_STATUS*\n"
+    "*Script:* `{script}`\n"
+    "*Provider:* `{provider_label}`\n"
+    "*Server:* `{server}`\n"
+    "*Status:* `{status}`\n"
+    "*Hostname:* `{hostname}`\n"
+    "*Timestamp:* `{timestamp}`\n"
+    "*Snapshot:* `{snapshot_name}`\n"
+    "*Total Snapshots:* `{snapshot_info}`"
+)
+
 def format_telegram_message_from_data(data: dict) -> str:
     """
     Formats notification data into a Markdown message for Telegram.
     Uses the same data structure as webhook payloads.
     """
-    provider_label = data.get('provider', 'unknown').upper()
-    formatted_message = (
-        f"*FINAL_STATUS*\n"
-        f"*Script:* `{data['script']}`\n"
-        f"*Provider:* `{provider_label}`\n"
-        f"*Server:* `{data['server']}`\n"
-        f"*Status:* `{data['status']}`\n"
-        f"*Hostname:* `{data['hostname']}`\n"
-        f"*Timestamp:* `{data['timestamp']}`\n"
-        f"*Snapshot:* `{data['snapshot_name']}`\n"
-        f"*Total Snapshots:* `{data['snapshot_info']}`"
-    )
-    return formatted_message
+    return _TG_MSG_TEMPLATE.format_map(dict(data, provider_label=data.get('provider', 'unknown').upper()))
 
 def format_telegram_message(raw_message: str) -> str:
     """
@@ -262,33 +353,55 @@ def format_telegram_message(raw_message: str) -> str:
 
     _, script_name, provider, server_name, status, hostname, timestamp, snapshot_name, snapshot_info = parts
     
-    # Extract server_id from snapshot_info if possible, otherwise use server_name
-    server_id = server_name  # Default fallback
-    
     # Parse total_snapshots from snapshot_info (e.g., "3 snapshots exist" -> 3)
-    total_snapshots = 0
     try:
-        match = re.search(r'(\d+)\s+snapshots', snapshot_info)
-        if match:
-            total_snapshots = int(match.group(1))
-    except:
-        pass
+        total_snapshots = int(snapshot_info.split(' ', 1)[0])
+    except (ValueError, IndexError):
+        total_snapshots = 0
     
-    data = create_notification_data(
-        script_name, server_name, server_id, status,
-        hostname, timestamp, snapshot_name, total_snapshots, provider
+    # Same layout as format_telegram_message_from_data, built directly from the parsed parts
+    return (
+        f"*FINAL_STATUS*\n"
+        f"*Script:* `{script_name}`\n"
+        f"*Provider:* `{provider.upper()}`\n"
+        f"*Server:* `{server_name}`\n"
+        f"*Status:* `{status.upper()}`\n"
+        f"*Hostname:* `{hostname}`\n"
+        f"*Timestamp:* `{timestamp}`\n"
+        f"*Snapshot:* `{snapshot_name}`\n"
+        f"*Total Snapshots:* `{total_snapshots} snapshots exist`"
     )
-    return format_telegram_message_from_data(data)
+
+def _response_snippet(response: requests.Response, limit: int = 200) -> str:
+    """
+    Decode only the first `limit` bytes of a response body for logging.
+    Avoids response.text, which detects the encoding and decodes the full body.
+    """
+    return response.content[:limit].decode('utf-8', errors='replace')
+
+# Shared HTTP session for Telegram/webhook notifications.
+# Reuses TCP/TLS connections (keep-alive) across retries and servers instead of
+# opening a new connection for every request.
+_SESSION = requests.Session()
+_SESSION_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_SESSION.mount('https://', _SESSION_ADAPTER)
+_SESSION.mount('http://', _SESSION_ADAPTER)
+
+# Thread pool for dispatching notifications in the background, so that retries with
+# exponential backoff don't block snapshot management of the remaining servers
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='notify')
 
 def send_telegram_notification(data: dict, logger: logging.Logger, 
                               bot_token: Optional[str] = None, 
                               chat_id: Optional[str] = None,
                               custom_message: Optional[str] = None,
+                              api_url: Optional[str] = None,
                               retries: int = None,
                               base_delay: int = None) -> bool:
     """
     Send a Telegram notification using standardized notification data.
     Uses per-server credentials if provided, otherwise falls back to global config.
+    api_url is the prebuilt sendMessage URL for the bot token (built here if not given).
     Implements exponential backoff for retries.
     Returns True if successful, False otherwise.
     """
@@ -304,7 +417,8 @@ def send_telegram_notification(data: dict, logger: logging.Logger,
     max_retries = retries if retries is not None else TELEGRAM_RETRIES
     base_delay_seconds = base_delay if base_delay is not None else TELEGRAM_BASE_DELAY_BETWEEN_RETRIES
     
-    api_url = f"https://api.telegram.org/bot{token}/sendMessage"
+    if not api_url:
+        api_url = _telegram_api_url(token)
     
     # Use custom message if provided, otherwise format from standardized data
     if custom_message:
@@ -319,18 +433,18 @@ def send_telegram_notification(data: dict, logger: logging.Logger,
                 "text": formatted_message,
                 "parse_mode": "Markdown"
             }
-            response = requests.post(api_url, data=payload, timeout=TELEGRAM_TIMEOUT)
+            response = _SESSION.post(api_url, data=payload, timeout=TELEGRAM_TIMEOUT)
             
             if response.status_code == 200:
                 logger.debug("Telegram notification sent successfully")
                 return True
             else:
-                sanitized_response = sanitize_telegram_output(response.text, token)
-                logger.warning(f"Telegram API error: {response.status_code} - {sanitized_response}")
+                sanitized_response = _LazySanitize(sanitize_telegram_output, _response_snippet(response), token)
+                logger.warning("Telegram API error: %s - %s", response.status_code, sanitized_response)
                 
         except requests.exceptions.RequestException as e:
-            error_msg = sanitize_telegram_output(str(e), token)
-            logger.warning(f"Telegram notification failed: {error_msg}")
+            error_msg = _LazySanitize(sanitize_telegram_output, str(e), token)
+            logger.warning("Telegram notification failed: %s", error_msg)
         
         if attempt < max_retries:
             # Exponential backoff: delay = base_delay * (2 ^ (attempt - 1))
@@ -341,12 +455,17 @@ def send_telegram_notification(data: dict, logger: logging.Logger,
     logger.warning(f"Failed to send Telegram notification after {max_retries} attempts")
     return False
 
+def _webhook_body(payload: dict) -> bytes:
+    """Serialize a webhook payload to the compact UTF-8 JSON request body (TypeError/ValueError if not serializable)."""
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
 def send_webhook_notification(logger: logging.Logger,
                               webhook_url: str,
                               payload: dict,
                               timeout: int = None,
                               retries: int = None,
-                              base_delay: int = None) -> bool:
+                              base_delay: int = None,
+                              body: Optional[bytes] = None) -> bool:
     """
     Send a webhook notification with JSON payload.
     Compatible with n8n webhook nodes and other standard webhook receivers.
@@ -355,6 +474,7 @@ def send_webhook_notification(logger: logging.Logger,
     
     The payload is sent as JSON in the request body with Content-Type: application/json header.
     n8n webhook nodes will receive this data in the $json context variable.
+    body is the already serialized payload (see _webhook_body), if the caller has it.
     """
     if not webhook_url:
         logger.debug("Webhook notification skipped: no URL provided")
@@ -365,15 +485,19 @@ def send_webhook_notification(logger: logging.Logger,
     max_retries = retries if retries is not None else WEBHOOK_RETRIES
     base_delay_seconds = base_delay if base_delay is not None else WEBHOOK_BASE_DELAY_BETWEEN_RETRIES
     
-    # Sanitize URL for logging (remove potential tokens/credentials)
-    sanitized_url = sanitize_log_output(webhook_url)
-    logger.debug(f"[WEBHOOK] Preparing notification to: {sanitized_url}")
-    logger.debug(f"[WEBHOOK] Payload size: {len(json.dumps(payload))} bytes")
-    logger.debug(f"[WEBHOOK] Payload keys: {list(payload.keys())}")
+    # Serialize once (compact) and reuse the body for every attempt and for size logging
+    if body is None:
+        body = _webhook_body(payload)
+    if logger.isEnabledFor(logging.DEBUG):
+        # Sanitize URL for logging (remove potential tokens/credentials)
+        sanitized_url = sanitize_log_output(webhook_url)
+        logger.debug(f"[WEBHOOK] Preparing notification to: {sanitized_url}")
+        logger.debug(f"[WEBHOOK] Payload size: {len(body)} bytes")
+        logger.debug(f"[WEBHOOK] Payload keys: {list(payload.keys())}")
     
     for attempt in range(1, max_retries + 1):
         logger.debug(f"[WEBHOOK] Attempt {attempt}/{max_retries} - Sending notification")
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             logger.debug(f"[WEBHOOK] POST request to webhook (timeout: {timeout_seconds}s)")
@@ -382,28 +506,29 @@ def send_webhook_notification(logger: logging.Logger,
                 'Content-Type': 'application/json',
                 'Accept': 'application/json'
             }
-            response = requests.post(webhook_url, json=payload, headers=headers, timeout=timeout_seconds)
-            request_time = time.time() - start_time
+            response = _SESSION.post(webhook_url, data=body, headers=headers, timeout=timeout_seconds)
+            request_time = time.monotonic() - start_time
             
             logger.debug(f"[WEBHOOK] Response received in {request_time:.2f}s (status: {response.status_code})")
             
             if response.status_code >= 200 and response.status_code < 300:
                 logger.debug(f"Webhook notification sent successfully (status: {response.status_code})")
-                sanitized_response = sanitize_log_output(response.text[:200])
-                logger.debug(f"[WEBHOOK] Response body (first 200 chars): {sanitized_response}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    sanitized_response = sanitize_log_output(_response_snippet(response))
+                    logger.debug(f"[WEBHOOK] Response body (first 200 chars): {sanitized_response}")
                 return True
             else:
-                sanitized_response = sanitize_log_output(response.text[:200])
-                logger.warning(f"Webhook API error: {response.status_code} - {sanitized_response}")
+                sanitized_response = _LazySanitize(sanitize_log_output, _response_snippet(response))
+                logger.warning("Webhook API error: %s - %s", response.status_code, sanitized_response)
                 
         except requests.exceptions.Timeout as e:
-            request_time = time.time() - start_time
-            error_msg = sanitize_log_output(str(e))
-            logger.warning(f"Webhook notification timeout after {request_time:.2f}s: {error_msg}")
+            request_time = time.monotonic() - start_time
+            error_msg = _LazySanitize(sanitize_log_output, str(e))
+            logger.warning("Webhook notification timeout after %.2fs: %s", request_time, error_msg)
         except requests.exceptions.RequestException as e:
-            request_time = time.time() - start_time
-            error_msg = sanitize_log_output(str(e))
-            logger.warning(f"Webhook notification failed after {request_time:.2f}s: {error_msg}")
+            request_time = time.monotonic() - start_time
+            error_msg = _LazySanitize(sanitize_log_output, str(e))
+            logger.warning("Webhook notification failed after %.2fs: %s", request_time, error_msg)
         
         if attempt < max_retries:
             # Exponential backoff: delay = base_delay * (2 ^ (attempt - 1))
@@ -414,6 +539,40 @@ def send_webhook_notification(logger: logging.Logger,
     logger.warning(f"Failed to send webhook notification after {max_retries} attempts")
     return False
 
+# Action polling: first check after 1 second, then back off by 1.5x up to 15 seconds between checks
+_POLL_INITIAL_DELAY = 1.0
+_POLL_BACKOFF_FACTOR = 1.5
+_POLL_MAX_DELAY = 15.0
+
+# Maximum number of snapshot DELETE requests in flight per server
+_MAX_PARALLEL_DELETES = 8
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Return the Retry-After header in seconds, or None if missing or not a number of seconds."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+_UTC = datetime.timezone.utc
+
+def _parse_iso_utc(s: str, _fromiso=datetime.datetime.fromisoformat) -> datetime.datetime:
+    """Parse an API timestamp like "2024-12-02T13:32:34Z" into an aware UTC datetime."""
+    return _fromiso(s[:-1] + '+00:00' if s.endswith('Z') else s).astimezone(_UTC)
+
+@functools.lru_cache(maxsize=32)
+def _auth_headers(api_token: str) -> MappingProxyType:
+    """Return the (read-only, cached per token) request headers for provider API calls."""
+    return MappingProxyType({
+        "Authorization": f"Bearer {api_token}",
+        "Content-Type": "application/json"
+    })
+
+# Placeholder values from the example configs that count as "not configured"
+_TELEGRAM_BOT_TOKEN_PLACEHOLDERS = frozenset({'', 'your_telegram_bot_token_here', 'your_telegram_bot_token'})
+_TELEGRAM_CHAT_ID_PLACEHOLDERS = frozenset({'', 'your_telegram_chat_id_here', 'your_telegram_chat_id'})
+_WEBHOOK_URL_PLACEHOLDERS = frozenset({'', 'https://your-webhook-url.com/notify', 'your-webhook-url.com', 'your_webhook_url_here'})
+
 @dataclass
 class ServerConfig:
     provider: str  # "digitalocean" or "hetzner"
@@ -421,10 +580,12 @@ class ServerConfig:
     name: str
     api_token: str
     retain_last_snapshots: int
+    masked_api_token: str = '***'  # Precomputed _mask_token(api_token) for logging
     # Telegram settings (optional - if not set, Telegram notifications are skipped for this server)
     telegram_enabled: bool = False
     telegram_bot_token: Optional[str] = None
     telegram_chat_id: Optional[str] = None
+    telegram_api_url: Optional[str] = None  # sendMessage URL, built once from telegram_bot_token
     telegram_message_success: Optional[str] = None  # Custom message template for success
     telegram_message_failure: Optional[str] = None  # Custom message template for failure
     # Webhook settings (optional - if not set, webhook notifications are skipped for this server)
@@ -432,11 +593,183 @@ class ServerConfig:
     webhook_url: Optional[str] = None
     webhook_payload_success: Optional[dict] = None  # Custom JSON payload for success
     webhook_payload_failure: Optional[dict] = None  # Custom JSON payload for failure
+    webhook_payload_success_plan: Optional[tuple] = None  # _plan_template_dict() of webhook_payload_success
+    webhook_payload_failure_plan: Optional[tuple] = None  # _plan_template_dict() of webhook_payload_failure
+
+    @classmethod
+    def from_validated(cls, provider: str, server_data: dict, telegram: dict, webhook: dict) -> 'ServerConfig':
+        """
+        Build a ServerConfig from a server JSON block and the already resolved notification settings.
+        The telegram/webhook dicts hold final values (enabled flag, None for unset fields), so only
+        the required server fields are converted here; raises ValueError for invalid values.
+        """
+        api_token = str(server_data['api_token'])
+        bot_token = telegram['bot_token']
+        payload_success = webhook['payload_success']
+        payload_failure = webhook['payload_failure']
+        return cls(
+            provider=provider,
+            id=str(server_data['id']),
+            name=str(server_data['name']),
+            api_token=api_token,
+            retain_last_snapshots=int(server_data['retain_last_snapshots']),
+            masked_api_token=_mask_token(api_token),
+            telegram_enabled=telegram['enabled'],
+            telegram_bot_token=bot_token,
+            telegram_chat_id=telegram['chat_id'],
+            telegram_api_url=_telegram_api_url(bot_token) if bot_token else None,
+            telegram_message_success=telegram['message_success'],
+            telegram_message_failure=telegram['message_failure'],
+            webhook_enabled=webhook['enabled'],
+            webhook_url=webhook['url'],
+            webhook_payload_success=payload_success,
+            webhook_payload_failure=payload_failure,
+            webhook_payload_success_plan=_plan_template_dict(payload_success) if payload_success else None,
+            webhook_payload_failure_plan=_plan_template_dict(payload_failure) if payload_failure else None
+        )
+
+# Template placeholders for custom Telegram messages and webhook payloads (matched in a single pass).
+# SnapshotManager._template_replacements() provides a value for each of these keys.
+_PLACEHOLDER_KEYS = ('{script}', '{provider}', '{server_name}', '{server_id}', '{droplet_name}', '{droplet_id}',
+                     '{snapshot_name}', '{total_snapshots}', '{snapshot_info}', '{status}', '{hostname}', '{timestamp}')
+_PLACEHOLDER_RE = re.compile('|'.join(map(re.escape, _PLACEHOLDER_KEYS)))
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(template: str) -> Tuple[Tuple[str, ...], Tuple[Optional[str], ...]]:
+    """
+    Split a template once into literal chunks and the placeholder following each chunk
+    (None after the last one), e.g. "a {status} b" -> (("a ", " b"), ("{status}", None)).
+    """
+    literals = []
+    keys = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(template):
+        literals.append(template[pos:match.start()])
+        keys.append(match.group(0))
+        pos = match.end()
+    literals.append(template[pos:])
+    keys.append(None)
+    return tuple(literals), tuple(keys)
+
+def _render_template(template: str, replacements: Dict[str, str]) -> str:
+    """Fill a template's placeholders from replacements (keyed by placeholder, e.g. '{status}')."""
+    if '{' not in template:
+        return template  # Literal text: no need to hash it for the compile cache
+    literals, keys = _compile_template(template)
+    if len(literals) == 1:
+        return template  # No placeholders
+    parts = []
+    for literal, key in zip(literals, keys):
+        parts.append(literal)
+        if key is not None:
+            parts.append(replacements[key])
+    return ''.join(parts)
+
+def _plan_template_dict(template_dict: dict) -> tuple:
+    """
+    Find the values of a (nested) payload dict that contain placeholders, so rendering can skip
+    everything else. Returns ((key, subplan), ...) where subplan is None for a string value, a
+    nested plan for a dict value, or a list of (index, subplan) for a list value. Like the
+    rendering itself, only strings and dicts directly inside lists are considered.
+    """
+    plan = []
+    for key, value in template_dict.items():
+        if isinstance(value, str):
+            if _PLACEHOLDER_RE.search(value):
+                plan.append((key, None))
+        elif isinstance(value, dict):
+            subplan = _plan_template_dict(value)
+            if subplan:
+                plan.append((key, subplan))
+        elif isinstance(value, list):
+            items = []
+            for index, item in enumerate(value):
+                if isinstance(item, str):
+                    if _PLACEHOLDER_RE.search(item):
+                        items.append((index, None))
+                elif isinstance(item, dict):
+                    subplan = _plan_template_dict(item)
+                    if subplan:
+                        items.append((index, subplan))
+            if items:
+                plan.append((key, items))
+    return tuple(plan)
+
+def _render_template_dict(template_dict: dict, replacements: Dict[str, str], plan: Optional[tuple] = None) -> dict:
+    """
+    Render the string values of a (nested) payload dict. Strings directly inside lists and
+    dicts inside lists are rendered too; other values (including nested lists) are kept as-is.
+    plan is the template's _plan_template_dict() (computed here if not given): only the values
+    it lists are rendered, literal values and subtrees are shared with the template.
+    """
+    if plan is None:
+        plan = _plan_template_dict(template_dict)
+    result = dict(template_dict)
+    for key, subplan in plan:
+        value = template_dict[key]
+        if subplan is None:
+            result[key] = _render_template(value, replacements)
+        elif isinstance(subplan, tuple):
+            result[key] = _render_template_dict(value, replacements, subplan)
+        else:
+            items = list(value)
+            for index, item_plan in subplan:
+                item = value[index]
+                items[index] = (_render_template(item, replacements) if item_plan is None
+                                else _render_template_dict(item, replacements, item_plan))
+            result[key] = items
+    return result
+
+# Plans for the fallback payload templates parsed at import (see _WEBHOOK_PAYLOAD_*_OBJ)
+_WEBHOOK_PAYLOAD_SUCCESS_PLAN = _plan_template_dict(_WEBHOOK_PAYLOAD_SUCCESS_OBJ) if _WEBHOOK_PAYLOAD_SUCCESS_OBJ else None
+_WEBHOOK_PAYLOAD_FAILURE_PLAN = _plan_template_dict(_WEBHOOK_PAYLOAD_FAILURE_OBJ) if _WEBHOOK_PAYLOAD_FAILURE_OBJ else None
+
+class SnapshotRecord(NamedTuple):
+    """A provider snapshot as used for retention (a plain tuple: no per-record dict)."""
+    created_at: datetime.datetime
+    id: str
+    name: str
+
+def partition_retain_delete(snapshots: List[SnapshotRecord], retain: int) -> Tuple[List[SnapshotRecord], List[SnapshotRecord]]:
+    """
+    Split snapshots into (retained, to_delete): the `retain` newest are kept, the rest deleted.
+    Both lists are newest first; the input list is left untouched.
+    """
+    ordered = sorted(snapshots, key=itemgetter(0), reverse=True)
+    return ordered[:retain], ordered[retain:]
+
+class _ProblemCounter(logging.Handler):
+    """Counts the warnings and errors logged while it is attached (see load_configs)."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
 
 class SnapshotManager:
-    def __init__(self, config_paths: List[str], verbose: bool = False):
+    def __init__(self, config_paths: List[str], verbose: bool = False, verify: bool = False):
+        # Logger is always available; handlers are attached in setup_logging()
+        self.logger = logging.getLogger('snapshots.py')
         self.config_paths = config_paths
         self.verbose = verbose
+        self.verify = verify  # Re-list snapshots at the end of each server instead of computing the count
+        self._notification_futures = []  # Notifications dispatched to _NOTIFY_POOL
+        self._hostname = os.uname().nodename  # Constant for the run; used in every status line and notification
+        # Runs each server's deletions alongside its snapshot creation (one slot per server worker)
+        self._step_pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_SERVERS, thread_name_prefix='cleanup')
+        # Shared session for provider API calls: keeps connections alive across listing pages,
+        # action polling and deletes, and retries transient errors (POST is never retried).
+        # Each provider host gets enough pooled connections for every server worker to run its
+        # parallel deletes at once, so no connection is opened just to be discarded afterwards
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16, pool_maxsize=MAX_PARALLEL_SERVERS * _MAX_PARALLEL_DELETES,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                              raise_on_status=False)
+        )
+        self._session.mount('https://', adapter)
         self.ensure_directories()
         self.setup_logging()
         
@@ -445,8 +778,13 @@ class SnapshotManager:
         self.logger.info("Initializing SnapshotManager")
         self.logger.info(f"Configuration files: {', '.join(config_paths) if config_paths else 'All .json files'}")
         self.logger.info(f"Verbose mode: {verbose}")
+        self.logger.debug(f"Verify final snapshot count: {verify}")
         self.logger.debug(f"Log file: {LOG_FILE}")
         self.logger.debug(f"Lock file: {LOCK_FILE}")
+        # Invalid fallback payload templates are reported once here instead of for every notification
+        for kind, error in (('success', _WEBHOOK_PAYLOAD_SUCCESS_ERROR), ('failure', _WEBHOOK_PAYLOAD_FAILURE_ERROR)):
+            if error is not None:
+                self.logger.warning(f"[CONFIG] Invalid JSON in fallback {kind} payload template: {error}. The default payload is used instead.")
         
         self.servers = self.load_configs()
         if not self.servers:
@@ -473,57 +811,79 @@ class SnapshotManager:
     def load_configs(self) -> List[ServerConfig]:
         """Load and validate JSON configuration files. Skip invalid files and log errors."""
         servers = []
+        cache = self._load_config_cache()
+        new_cache = {}  # full_path -> ((mtime_ns, size), ServerConfig) for the configs validated in this run
+        # Files whose validation logged a warning or error are not cached, so the message is repeated every run
+        problems = _ProblemCounter()
+        self.logger.addHandler(problems)
+        try:
+            self._load_configs(servers, cache, new_cache, problems)
+        finally:
+            self.logger.removeHandler(problems)
+        
+        if new_cache.keys() != cache.keys() or any(new_cache[p][0] != cache[p][0] for p in new_cache):
+            self._save_config_cache(new_cache)
+        return servers
+
+    def _load_configs(self, servers: List[ServerConfig], cache: dict, new_cache: dict, problems: '_ProblemCounter'):
+        """load_configs() body: validate each config file (or reuse its cached config) into servers/new_cache."""
         for path in self.config_paths:
-            full_path = os.path.join(CONFIGS_DIR, path)
+            # Plain file names (the common case) are simply appended to the configs dir;
+            # paths with directory components (or absolute paths) go through os.path.join
+            full_path = CONFIGS_DIR_SLASH + path if os.sep not in path else os.path.join(CONFIGS_DIR, path)
             
             # Skip macOS resource fork files (._*)
             if os.path.basename(path).startswith('._'):
-                if hasattr(self, 'logger'):
-                    self.logger.debug(f"Skipping macOS resource fork file: '{full_path}'")
+                self.logger.debug(f"Skipping macOS resource fork file: '{full_path}'")
                 continue
             
             # Skip non-JSON files
             if not path.lower().endswith('.json'):
-                if hasattr(self, 'logger'):
-                    self.logger.warning(f"Skipping non-JSON file: '{full_path}'")
-                else:
-                    print(f"WARNING: Skipping non-JSON file: '{full_path}'", file=sys.stderr)
+                self.logger.warning(f"Skipping non-JSON file: '{full_path}'")
                 continue
             
-            if not os.path.exists(full_path):
-                if hasattr(self, 'logger'):
-                    self.logger.error(f"Configuration file '{full_path}' does not exist. Skipping.")
-                else:
-                    print(f"ERROR: Configuration file '{full_path}' does not exist. Skipping.", file=sys.stderr)
+            # Single stat: existence check plus size gate (skip obvious junk before open + parse)
+            try:
+                st = os.stat(full_path)
+            except OSError:
+                self.logger.error(f"Configuration file '{full_path}' does not exist. Skipping.")
+                continue
+            file_size = st.st_size
+            if file_size == 0:
+                self.logger.error(f"Configuration file '{full_path}' is empty. Skipping.")
+                continue
+            if file_size > MAX_CONFIG_FILE_SIZE:
+                self.logger.warning(f"Configuration file '{full_path}' is too large ({file_size} bytes, max {MAX_CONFIG_FILE_SIZE}). Skipping.")
+                continue
+            
+            # Unchanged since the last run: reuse the already validated config
+            file_key = (st.st_mtime_ns, file_size)
+            cached = cache.get(full_path)
+            if cached is not None and cached[0] == file_key:
+                servers.append(cached[1])
+                new_cache[full_path] = cached
+                self.logger.debug(f"Loaded config: {cached[1].name} (Provider: {cached[1].provider}, ID: {cached[1].id}, Retain: {cached[1].retain_last_snapshots}, API Token: {cached[1].masked_api_token}) [cached]")
                 continue
             
             # Validate JSON syntax and structure
+            problems_before = problems.count
             try:
-                # Try to open with UTF-8 encoding, skip if encoding error
+                # Parse raw bytes (UTF-8), skip if encoding error
                 try:
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
+                    with open(full_path, 'rb') as f:
+                        config = _json_loads(f.read())
                 except UnicodeDecodeError as e:
-                    if hasattr(self, 'logger'):
-                        self.logger.warning(f"Configuration file '{full_path}' is not valid UTF-8 (likely binary file). Skipping.")
-                    else:
-                        print(f"WARNING: Configuration file '{full_path}' is not valid UTF-8. Skipping.", file=sys.stderr)
+                    self.logger.warning(f"Configuration file '{full_path}' is not valid UTF-8 (likely binary file). Skipping.")
                     continue
                 
                 # Check if JSON is valid but empty or None
                 if config is None:
-                    if hasattr(self, 'logger'):
-                        self.logger.error(f"Configuration file '{full_path}' is empty or null. Skipping.")
-                    else:
-                        print(f"ERROR: Configuration file '{full_path}' is empty or null. Skipping.", file=sys.stderr)
+                    self.logger.error(f"Configuration file '{full_path}' is empty or null. Skipping.")
                     continue
                 
                 # Validate structure
                 if not isinstance(config, dict):
-                    if hasattr(self, 'logger'):
-                        self.logger.error(f"Configuration file '{full_path}' does not contain a valid JSON object. Skipping.")
-                    else:
-                        print(f"ERROR: Configuration file '{full_path}' does not contain a valid JSON object. Skipping.", file=sys.stderr)
+                    self.logger.error(f"Configuration file '{full_path}' does not contain a valid JSON object. Skipping.")
                     continue
                 
                 # Detect provider type from JSON structure
@@ -537,186 +897,231 @@ class SnapshotManager:
                     server_data = config['hetzner_cloud_server']
                     provider = 'hetzner'
                 else:
-                    if hasattr(self, 'logger'):
-                        self.logger.error(f"Configuration file '{full_path}' must contain either 'digitalocean_droplet' or 'hetzner_cloud_server' key. Skipping.")
-                    else:
-                        print(f"ERROR: Configuration file '{full_path}' must contain either 'digitalocean_droplet' or 'hetzner_cloud_server' key. Skipping.", file=sys.stderr)
+                    self.logger.error(f"Configuration file '{full_path}' must contain either 'digitalocean_droplet' or 'hetzner_cloud_server' key. Skipping.")
                     continue
                 
                 if not isinstance(server_data, dict):
-                    if hasattr(self, 'logger'):
-                        self.logger.error(f"Configuration file '{full_path}': server key does not contain a dictionary. Skipping.")
-                    else:
-                        print(f"ERROR: Configuration file '{full_path}': server key does not contain a dictionary. Skipping.", file=sys.stderr)
+                    self.logger.error(f"Configuration file '{full_path}': server key does not contain a dictionary. Skipping.")
                     continue
                 
                 # Validate provider field matches
                 config_provider = server_data.get('provider', '').lower()
                 if config_provider and config_provider != provider:
-                    if hasattr(self, 'logger'):
-                        self.logger.warning(f"Configuration file '{full_path}': provider field '{config_provider}' doesn't match key type '{provider}'. Using '{provider}'.")
+                    self.logger.warning(f"Configuration file '{full_path}': provider field '{config_provider}' doesn't match key type '{provider}'. Using '{provider}'.")
                     provider = config_provider  # Use the provider from the config
                 
                 # Validate required fields
                 required_fields = ['id', 'name', 'api_token', 'retain_last_snapshots']
                 missing_fields = [field for field in required_fields if field not in server_data]
                 if missing_fields:
-                    if hasattr(self, 'logger'):
-                        self.logger.error(f"Configuration file '{full_path}' is missing required field(s): {', '.join(missing_fields)}. Skipping.")
-                    else:
-                        print(f"ERROR: Configuration file '{full_path}' is missing required field(s): {', '.join(missing_fields)}. Skipping.", file=sys.stderr)
+                    self.logger.error(f"Configuration file '{full_path}' is missing required field(s): {', '.join(missing_fields)}. Skipping.")
                     continue
                 
                 # Extract optional Telegram settings
-                telegram_config = server_data.get('telegram', {})
+                telegram_config = server_data.get('telegram')
+                if not isinstance(telegram_config, dict):
+                    telegram_config = {}  # Missing or malformed: treat as not configured
                 # Check if telegram is explicitly configured in JSON
-                telegram_enabled_json = telegram_config.get('enabled', None) if isinstance(telegram_config, dict) else None
-                telegram_bot_token_raw = telegram_config.get('bot_token', '').strip() if isinstance(telegram_config, dict) else None
-                telegram_chat_id_raw = telegram_config.get('chat_id', '').strip() if isinstance(telegram_config, dict) else None
-                telegram_message_success = telegram_config.get('message_success') if isinstance(telegram_config, dict) else None
-                telegram_message_failure = telegram_config.get('message_failure') if isinstance(telegram_config, dict) else None
+                telegram_enabled_json = telegram_config.get('enabled')
+                telegram_bot_token_raw = telegram_config.get('bot_token', '').strip()
+                telegram_chat_id_raw = telegram_config.get('chat_id', '').strip()
+                telegram_message_success = telegram_config.get('message_success')
+                telegram_message_failure = telegram_config.get('message_failure')
                 
-                # Check if credentials are missing or placeholder values
-                telegram_bot_token = None
-                telegram_chat_id = None
-                if telegram_bot_token_raw and telegram_bot_token_raw.lower() not in ['', 'your_telegram_bot_token_here', 'your_telegram_bot_token']:
-                    telegram_bot_token = telegram_bot_token_raw
-                if telegram_chat_id_raw and telegram_chat_id_raw.lower() not in ['', 'your_telegram_chat_id_here', 'your_telegram_chat_id']:
-                    telegram_chat_id = telegram_chat_id_raw
-                
-                # Determine if Telegram should be enabled
-                # If explicitly enabled in JSON, use it (with fallback credentials if needed)
-                # If not configured in JSON, use global enabled flag
-                if telegram_enabled_json is True:
-                    telegram_enabled = True
-                    # If Telegram is enabled in JSON but credentials are missing, use fallback from config
-                    if not telegram_bot_token or not telegram_chat_id:
-                        if hasattr(self, 'logger'):
-                            self.logger.debug(f"[CONFIG] Telegram enabled in JSON for '{server_data.get('name', 'unknown')}' but credentials missing, using fallback from snapshots.config")
-                        if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
-                            telegram_bot_token = TELEGRAM_BOT_TOKEN
-                            telegram_chat_id = TELEGRAM_CHAT_ID
-                            if hasattr(self, 'logger'):
-                                self.logger.debug(f"[CONFIG] Using fallback Telegram credentials from snapshots.config")
-                        else:
-                            if hasattr(self, 'logger'):
-                                self.logger.error(f"[CONFIG] Telegram enabled in JSON for '{server_data.get('name', 'unknown')}' but no credentials found in JSON or fallback config. Telegram notifications will be skipped.")
-                            telegram_enabled = False  # Disable if no credentials available
-                elif telegram_enabled_json is False:
-                    # Explicitly disabled in JSON, don't use global fallback
-                    telegram_enabled = False
-                else:
-                    # Not configured in JSON, use global enabled flag
-                    telegram_enabled = TELEGRAM_ENABLED
-                    if telegram_enabled:
-                        # Use global credentials if per-server credentials are not available
-                        if not telegram_bot_token and TELEGRAM_BOT_TOKEN:
-                            telegram_bot_token = TELEGRAM_BOT_TOKEN
-                        if not telegram_chat_id and TELEGRAM_CHAT_ID:
-                            telegram_chat_id = TELEGRAM_CHAT_ID
-                        if hasattr(self, 'logger') and (telegram_bot_token or telegram_chat_id):
-                            self.logger.debug(f"[CONFIG] Using global Telegram settings for '{server_data.get('name', 'unknown')}'")
+                # Ignore missing credentials and placeholder values
+                telegram_values = {
+                    'bot_token': telegram_bot_token_raw if telegram_bot_token_raw and telegram_bot_token_raw.lower() not in _TELEGRAM_BOT_TOKEN_PLACEHOLDERS else None,
+                    'chat_id': telegram_chat_id_raw if telegram_chat_id_raw and telegram_chat_id_raw.lower() not in _TELEGRAM_CHAT_ID_PLACEHOLDERS else None
+                }
+                telegram_enabled, telegram_values = self._resolve_notifier(
+                    'Telegram', 'Telegram', 'credentials', server_data.get('name', 'unknown'),
+                    telegram_enabled_json, telegram_values,
+                    TELEGRAM_ENABLED, {'bot_token': TELEGRAM_BOT_TOKEN, 'chat_id': TELEGRAM_CHAT_ID}
+                )
+                telegram_bot_token = telegram_values['bot_token']
+                telegram_chat_id = telegram_values['chat_id']
                 
                 # Extract optional webhook settings
-                webhook_config = server_data.get('webhook', {})
+                webhook_config = server_data.get('webhook')
+                if not isinstance(webhook_config, dict):
+                    webhook_config = {}  # Missing or malformed: treat as not configured
                 # Check if webhook is explicitly configured in JSON
-                webhook_enabled_json = webhook_config.get('enabled', None) if isinstance(webhook_config, dict) else None
-                webhook_url_raw = webhook_config.get('url', '').strip() if isinstance(webhook_config, dict) else None
-                webhook_payload_success = webhook_config.get('payload_success') if isinstance(webhook_config, dict) else None
-                webhook_payload_failure = webhook_config.get('payload_failure') if isinstance(webhook_config, dict) else None
-                
-                # Check if URL is missing or placeholder value
-                webhook_url = None
-                if webhook_url_raw and webhook_url_raw.lower() not in ['', 'https://your-webhook-url.com/notify', 'your-webhook-url.com', 'your_webhook_url_here']:
-                    webhook_url = webhook_url_raw
+                webhook_enabled_json = webhook_config.get('enabled')
+                webhook_url_raw = webhook_config.get('url', '').strip()
+                webhook_payload_success = webhook_config.get('payload_success')
+                webhook_payload_failure = webhook_config.get('payload_failure')
                 
-                # Determine if webhook should be enabled
-                # If explicitly enabled in JSON, use it (with fallback URL if needed)
-                # If not configured in JSON, use global enabled flag
-                if webhook_enabled_json is True:
-                    webhook_enabled = True
-                    # If webhook is enabled in JSON but URL is missing, use fallback from config
-                    if not webhook_url:
-                        if hasattr(self, 'logger'):
-                            self.logger.debug(f"[CONFIG] Webhook enabled in JSON for '{server_data.get('name', 'unknown')}' but URL missing, using fallback from snapshots.config")
-                        if WEBHOOK_URL:
-                            webhook_url = WEBHOOK_URL
-                            if hasattr(self, 'logger'):
-                                self.logger.debug(f"[CONFIG] Using fallback webhook URL from snapshots.config")
-                        else:
-                            if hasattr(self, 'logger'):
-                                self.logger.error(f"[CONFIG] Webhook enabled in JSON for '{server_data.get('name', 'unknown')}' but no URL found in JSON or fallback config. Webhook notifications will be skipped.")
-                            webhook_enabled = False  # Disable if no URL available
-                elif webhook_enabled_json is False:
-                    # Explicitly disabled in JSON, don't use global fallback
-                    webhook_enabled = False
-                else:
-                    # Not configured in JSON, use global enabled flag
-                    webhook_enabled = WEBHOOK_ENABLED
-                    if webhook_enabled:
-                        # Use global URL if per-server URL is not available
-                        if not webhook_url and WEBHOOK_URL:
-                            webhook_url = WEBHOOK_URL
-                        if hasattr(self, 'logger') and webhook_url:
-                            self.logger.debug(f"[CONFIG] Using global webhook settings for '{server_data.get('name', 'unknown')}'")
+                # Ignore a missing URL and placeholder values
+                webhook_enabled, webhook_values = self._resolve_notifier(
+                    'Webhook', 'webhook', 'URL', server_data.get('name', 'unknown'),
+                    webhook_enabled_json,
+                    {'url': webhook_url_raw if webhook_url_raw and webhook_url_raw.lower() not in _WEBHOOK_URL_PLACEHOLDERS else None},
+                    WEBHOOK_ENABLED, {'url': WEBHOOK_URL}
+                )
+                webhook_url = webhook_values['url']
                 
                 # Validate and convert data types
                 try:
-                    server_config = ServerConfig(
-                        provider=provider,
-                        id=str(server_data['id']),
-                        name=str(server_data['name']),
-                        api_token=str(server_data['api_token']),
-                        retain_last_snapshots=int(server_data['retain_last_snapshots']),
-                        telegram_enabled=bool(telegram_enabled) if telegram_enabled else False,
-                        telegram_bot_token=telegram_bot_token if telegram_bot_token else None,
-                        telegram_chat_id=telegram_chat_id if telegram_chat_id else None,
-                        telegram_message_success=str(telegram_message_success) if telegram_message_success else None,
-                        telegram_message_failure=str(telegram_message_failure) if telegram_message_failure else None,
-                        webhook_enabled=bool(webhook_enabled) if webhook_enabled else False,
-                        webhook_url=webhook_url if webhook_url else None,
-                        webhook_payload_success=webhook_payload_success if isinstance(webhook_payload_success, dict) else None,
-                        webhook_payload_failure=webhook_payload_failure if isinstance(webhook_payload_failure, dict) else None
+                    server_config = ServerConfig.from_validated(
+                        provider, server_data,
+                        telegram={
+                            'enabled': telegram_enabled,
+                            'bot_token': telegram_bot_token,
+                            'chat_id': telegram_chat_id,
+                            'message_success': str(telegram_message_success) if telegram_message_success else None,
+                            'message_failure': str(telegram_message_failure) if telegram_message_failure else None
+                        },
+                        webhook={
+                            'enabled': webhook_enabled,
+                            'url': webhook_url,
+                            'payload_success': webhook_payload_success if isinstance(webhook_payload_success, dict) else None,
+                            'payload_failure': webhook_payload_failure if isinstance(webhook_payload_failure, dict) else None
+                        }
                     )
                     servers.append(server_config)
-                    if hasattr(self, 'logger'):
-                        masked_token = server_config.api_token[:6] + '...' + server_config.api_token[-6:] if len(server_config.api_token) > 12 else '***'
-                        self.logger.debug(f"Loaded config: {server_config.name} (Provider: {provider}, ID: {server_config.id}, Retain: {server_config.retain_last_snapshots}, API Token: {masked_token})")
+                    if problems.count == problems_before:
+                        new_cache[full_path] = (file_key, server_config)
+                    self.logger.debug(f"Loaded config: {server_config.name} (Provider: {provider}, ID: {server_config.id}, Retain: {server_config.retain_last_snapshots}, API Token: {server_config.masked_api_token})")
                 except ValueError as ve:
-                    if hasattr(self, 'logger'):
-                        self.logger.error(f"Invalid data type in '{full_path}': {ve}. Skipping.")
-                    else:
-                        print(f"ERROR: Invalid data type in '{full_path}': {ve}. Skipping.", file=sys.stderr)
+                    self.logger.error(f"Invalid data type in '{full_path}': {ve}. Skipping.")
                     continue
                     
             except json.JSONDecodeError as e:
-                if hasattr(self, 'logger'):
-                    self.logger.error(f"Error parsing JSON file '{full_path}': {e}. Skipping.")
-                else:
-                    print(f"ERROR: Error parsing JSON file '{full_path}': {e}. Skipping.", file=sys.stderr)
+                self.logger.error(f"Error parsing JSON file '{full_path}': {e}. Skipping.")
                 continue
             except Exception as e:
                 # Sanitize error message to avoid leaking config file contents
                 error_msg = str(e)
                 # Remove any potential token-like strings from error messages
                 error_msg = sanitize_log_output(error_msg)
-                if hasattr(self, 'logger'):
-                    self.logger.error(f"Unexpected error processing '{full_path}': {error_msg}. Skipping.")
-                else:
-                    print(f"ERROR: Unexpected error processing '{full_path}': {error_msg}. Skipping.", file=sys.stderr)
+                self.logger.error(f"Unexpected error processing '{full_path}': {error_msg}. Skipping.")
                 continue
-        
-        return servers
 
+    def _resolve_notifier(self, title: str, label: str, what: str, server_name: str,
+                          enabled_json: Optional[bool], values: Dict[str, Optional[str]],
+                          global_enabled: bool, global_values: Dict[str, Optional[str]]):
+        """
+        Apply the fallback rules shared by Telegram and webhook settings.
+        - Explicitly enabled in JSON: use the JSON values; if any is missing, use all values from
+          snapshots.config instead, or disable the notifier if those are incomplete too
+        - Explicitly disabled in JSON: disabled, no global fallback
+        - Not configured in JSON: use the global enabled flag and fill in missing values from snapshots.config
+        Returns (enabled, values).
+        """
+        if enabled_json is True:
+            enabled = True
+            if not all(values.values()):
+                self.logger.debug(f"[CONFIG] {title} enabled in JSON for '{server_name}' but {what} missing, using fallback from snapshots.config")
+                if all(global_values.values()):
+                    values = dict(global_values)
+                    self.logger.debug(f"[CONFIG] Using fallback {label} {what} from snapshots.config")
+                else:
+                    self.logger.error(f"[CONFIG] {title} enabled in JSON for '{server_name}' but no {what} found in JSON or fallback config. {title} notifications will be skipped.")
+                    enabled = False  # Disable if nothing usable is available
+        elif enabled_json is False:
+            enabled = False
+        else:
+            enabled = global_enabled
+            if enabled:
+                values = {key: value or global_values[key] for key, value in values.items()}
+                if any(values.values()):
+                    self.logger.debug(f"[CONFIG] Using global {label} settings for '{server_name}'")
+        return enabled, values
+
+    def _config_cache_signature(self) -> list:
+        """
+        Everything besides the JSON file itself that a validated ServerConfig depends on:
+        the global fallback settings and the ServerConfig fields (changes invalidate the cache).
+        A list of JSON values, so it compares equal to the signature read back from the cache file.
+        """
+        return [[f.name for f in fields(ServerConfig)],
+                TELEGRAM_ENABLED, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, WEBHOOK_ENABLED, WEBHOOK_URL]
+
+    def _load_config_cache(self) -> dict:
+        """
+        Load validated server configs from CONFIG_CACHE_FILE. Returns {} if missing, stale or unreadable.
+        The file is only trusted if it is a regular file owned by the current user with mode 0600.
+        """
+        if not CONFIG_CACHE_FILE:
+            return {}
+        try:
+            fd = os.open(CONFIG_CACHE_FILE, os.O_RDONLY | os.O_NOFOLLOW | os.O_CLOEXEC)
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            self.logger.warning(f"[CONFIG] Ignoring config cache '{CONFIG_CACHE_FILE}': {e}")
+            return {}
+        try:
+            with os.fdopen(fd, 'rb') as f:
+                st = os.fstat(f.fileno())
+                if not stat.S_ISREG(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o600:
+                    self.logger.warning(f"[CONFIG] Ignoring config cache '{CONFIG_CACHE_FILE}': "
+                                        f"not a regular file owned by the current user with mode 0600")
+                    return {}
+                data = _json_loads(f.read())
+            if not isinstance(data, dict) or data.get('signature') != self._config_cache_signature():
+                self.logger.debug(f"[CONFIG] Config cache is outdated, revalidating all configuration files")
+                return {}
+            return {
+                full_path: ((entry['mtime_ns'], entry['size']), ServerConfig.from_validated(
+                    entry['provider'], entry['server'], entry['telegram'], entry['webhook']))
+                for full_path, entry in data['entries'].items()
+            }
+        except Exception as e:
+            self.logger.debug(f"[CONFIG] Ignoring unreadable config cache '{CONFIG_CACHE_FILE}': {e}")
+            return {}
+
+    def _save_config_cache(self, entries: dict):
+        """Write validated server configs to CONFIG_CACHE_FILE as JSON (mode 0600, it contains API tokens)."""
+        if not CONFIG_CACHE_FILE:
+            return
+        data = {
+            'signature': self._config_cache_signature(),
+            'entries': {
+                full_path: {
+                    'mtime_ns': file_key[0],
+                    'size': file_key[1],
+                    # The ServerConfig.from_validated() arguments, so loading rebuilds derived fields
+                    'provider': server.provider,
+                    'server': {'id': server.id, 'name': server.name, 'api_token': server.api_token,
+                               'retain_last_snapshots': server.retain_last_snapshots},
+                    'telegram': {'enabled': server.telegram_enabled, 'bot_token': server.telegram_bot_token,
+                                 'chat_id': server.telegram_chat_id,
+                                 'message_success': server.telegram_message_success,
+                                 'message_failure': server.telegram_message_failure},
+                    'webhook': {'enabled': server.webhook_enabled, 'url': server.webhook_url,
+                                'payload_success': server.webhook_payload_success,
+                                'payload_failure': server.webhook_payload_failure}
+                }
+                for full_path, (file_key, server) in entries.items()
+            }
+        }
+        tmp_path = CONFIG_CACHE_FILE + '.tmp'
+        try:
+            # Never reuse a leftover temp file: O_CREAT only applies the mode to new files
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW | os.O_CLOEXEC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                os.fchmod(f.fileno(), 0o600)  # Exactly 0600 regardless of the umask (checked when loading)
+                json.dump(data, f)
+            os.replace(tmp_path, CONFIG_CACHE_FILE)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"[CONFIG] Failed to write config cache '{CONFIG_CACHE_FILE}': {e}")
 
     def setup_logging(self):
-        self.logger = logging.getLogger('snapshots.py')
         self.logger.setLevel(LOG_LEVEL)
         handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
         
         # Improved formatter with better structure and alignment
+        # When servers are processed in parallel, their log lines interleave, so tag each line with the worker thread
+        fmt = '%(asctime)s | %(levelname)-8s | %(message)s'
+        if MAX_PARALLEL_SERVERS > 1:
+            fmt = '%(asctime)s | %(levelname)-8s | %(threadName)-10s | %(message)s'
         formatter = logging.Formatter(
-            fmt='%(asctime)s | %(levelname)-8s | %(message)s',
+            fmt=fmt,
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         handler.setFormatter(formatter)
@@ -729,78 +1134,63 @@ class SnapshotManager:
 
     def error_exit(self, message: str, exit_code: int = 1):
         """Log error and exit with specified exit code."""
-        if hasattr(self, 'logger'):
-            self.logger.error(message)
-        else:
-            print(f"ERROR: {message}", file=sys.stderr)
+        self.logger.error(message)
         sys.exit(exit_code)
 
 
-    def get_snapshots(self, server: ServerConfig) -> List[dict]:
+    def get_snapshots(self, server: ServerConfig) -> List[SnapshotRecord]:
         """Get snapshots for a server, routing to provider-specific method."""
         self.logger.info(f"Retrieving snapshots for {server.provider} server '{server.name}' (ID: {server.id})")
-        if server.provider == "digitalocean":
-            return self.get_digitalocean_snapshots(server)
-        elif server.provider == "hetzner":
-            return self.get_hetzner_snapshots(server)
-        else:
+        handler = self._GET.get(server.provider)
+        if handler is None:
             self.logger.error(f"Unknown provider: {server.provider}")
             return []
+        return handler(self, server)
     
-    def get_digitalocean_snapshots(self, server: ServerConfig) -> List[dict]:
+    def get_digitalocean_snapshots(self, server: ServerConfig) -> List[SnapshotRecord]:
         """Get snapshots for a DigitalOcean droplet using direct API call."""
         self.logger.debug(f"Listing DigitalOcean snapshots for droplet ID: {server.id}")
         snapshots = []
         
-        # DigitalOcean API v2: GET /snapshots?resource_type=droplet
+        # DigitalOcean API v2: GET /droplets/{id}/snapshots (only this droplet's snapshots)
         base_url = "https://api.digitalocean.com/v2"
-        headers = {
-            "Authorization": f"Bearer {server.api_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _auth_headers(server.api_token)
         
         page = 1
         per_page = 200
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)  # Skip strftime for per-snapshot debug lines
         
         while True:
             try:
-                url = f"{base_url}/snapshots"
+                url = f"{base_url}/droplets/{server.id}/snapshots"
                 params = {
-                    "resource_type": "droplet",
                     "per_page": per_page,
                     "page": page
                 }
                 
-                self.logger.debug(f"[DIGITALOCEAN] Fetching snapshots page {page}")
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                self.logger.debug("[DIGITALOCEAN] Fetching snapshots page %d", page)
+                response = self._session.get(url, headers=headers, params=params, timeout=30)
                 response.raise_for_status()
                 
-                data = response.json()
+                data = _json_loads(response.content)
                 snapshot_list = data.get("snapshots", [])
                 
                 if not snapshot_list:
                     break
                 
                 for snapshot in snapshot_list:
-                    # Filter snapshots that match our droplet ID or name
-                    resource_id = snapshot.get("resource_id")
                     snapshot_name = snapshot.get("name", "")
+                    snapshot_id = snapshot.get("id")
+                    created_at_str = snapshot.get("created_at", "")
                     
-                    if str(resource_id) == str(server.id) or server.name in snapshot_name:
-                        snapshot_id = snapshot.get("id")
-                        created_at_str = snapshot.get("created_at", "")
-                        
-                        try:
-                            # DigitalOcean uses ISO format: "2024-12-02T13:32:34Z"
-                            created_at = datetime.datetime.fromisoformat(created_at_str.replace('Z', '+00:00')).astimezone(datetime.timezone.utc)
-                            snapshots.append({
-                                "id": str(snapshot_id),
-                                "name": snapshot_name,
-                                "created_at": created_at
-                            })
-                            self.logger.debug(f"  Found snapshot: {snapshot_name} (ID: {snapshot_id}, Created: {created_at.strftime('%Y-%m-%d %H:%M:%S')})")
-                        except (ValueError, KeyError) as e:
-                            self.logger.error(f"  Invalid date format for snapshot '{snapshot_name}': {created_at_str}")
+                    try:
+                        # DigitalOcean uses ISO format: "2024-12-02T13:32:34Z"
+                        created_at = _parse_iso_utc(created_at_str)
+                        snapshots.append(SnapshotRecord(created_at, str(snapshot_id), snapshot_name))
+                        if debug_enabled:
+                            self.logger.debug("  Found snapshot: %s (ID: %s, Created: %s)", snapshot_name, snapshot_id, created_at.strftime('%Y-%m-%d %H:%M:%S'))
+                    except (ValueError, KeyError) as e:
+                        self.logger.error("  Invalid date format for snapshot '%s': %s", snapshot_name, created_at_str)
                 
                 # Check if there are more pages
                 links = data.get("links", {})
@@ -809,29 +1199,63 @@ class SnapshotManager:
                 else:
                     break
                     
-            except requests.exceptions.RequestException as e:
-                error_msg = sanitize_log_output(str(e), server.api_token)
-                self.logger.error(f"[DIGITALOCEAN] Failed to fetch snapshots: {error_msg}")
+            except (requests.exceptions.RequestException, ValueError) as e:  # ValueError: malformed JSON body
+                error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+                self.logger.error("[DIGITALOCEAN] Failed to fetch snapshots: %s", error_msg)
                 break
             except Exception as e:
-                error_msg = sanitize_log_output(str(e), server.api_token)
-                self.logger.error(f"[DIGITALOCEAN] Unexpected error fetching snapshots: {error_msg}")
+                error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+                self.logger.error("[DIGITALOCEAN] Unexpected error fetching snapshots: %s", error_msg)
                 break
 
         self.logger.info(f"Found {len(snapshots)} snapshot(s) for droplet '{server.name}'")
         return snapshots
     
-    def get_hetzner_snapshots(self, server: ServerConfig) -> List[dict]:
+    def get_hetzner_snapshots(self, server: ServerConfig) -> List[SnapshotRecord]:
         """Get snapshots for a Hetzner Cloud server using direct API call."""
         self.logger.debug(f"Listing Hetzner Cloud snapshots for server ID: {server.id}")
+        images = self._fetch_hetzner_images(server)
+        
         snapshots = []
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)  # Skip strftime for per-snapshot debug lines
+        try:
+            for image in images:
+                # Hetzner images have a 'description' field that contains the snapshot name
+                # and 'created' field for timestamp
+                description = image.get("description", "")
+                # Filter snapshots that match our server name pattern or were created from this server
+                if server.name in description or description.startswith(server.name):
+                    snapshot_id = str(image.get("id", ""))
+                    snapshot_name = description
+                    created_at_str = image.get("created", "")
+                    
+                    try:
+                        # Hetzner uses ISO format: "2024-12-02T13:32:34Z"
+                        created_at = _parse_iso_utc(created_at_str)
+                        snapshots.append(SnapshotRecord(created_at, snapshot_id, snapshot_name))
+                        if debug_enabled:
+                            self.logger.debug("  Found snapshot: %s (ID: %s, Created: %s)", snapshot_name, snapshot_id, created_at.strftime('%Y-%m-%d %H:%M:%S'))
+                    except (ValueError, KeyError) as e:
+                        self.logger.error("  Invalid date format for snapshot '%s': %s", snapshot_name, created_at_str)
+        except Exception as e:
+            error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+            self.logger.error("[HETZNER] Unexpected error fetching snapshots: %s", error_msg)
+
+        self.logger.info(f"Found {len(snapshots)} snapshot(s) for server '{server.name}'")
+        return snapshots
+
+    def _fetch_hetzner_images(self, server: ServerConfig) -> List[dict]:
+        """
+        Fetch all snapshot images visible to the server's API token (all pages).
+        Hetzner has no server-side filter for snapshots (bound_to only applies to backups),
+        so matching to servers happens client-side.
+        On errors, logs and returns the images fetched so far.
+        """
+        images = []
         
         # Hetzner Cloud API v1: GET /images?type=snapshot
         base_url = "https://api.hetzner.cloud/v1"
-        headers = {
-            "Authorization": f"Bearer {server.api_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _auth_headers(server.api_token)
         
         page = 1
         per_page = 50
@@ -845,37 +1269,16 @@ class SnapshotManager:
                     "page": page
                 }
                 
-                self.logger.debug(f"[HETZNER] Fetching snapshots page {page}")
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                self.logger.debug("[HETZNER] Fetching snapshots page %d", page)
+                response = self._session.get(url, headers=headers, params=params, timeout=30)
                 response.raise_for_status()
                 
-                data = response.json()
-                images = data.get("images", [])
+                data = _json_loads(response.content)
+                page_images = data.get("images", [])
                 
-                if not images:
+                if not page_images:
                     break
-                
-                for image in images:
-                    # Hetzner images have a 'description' field that contains the snapshot name
-                    # and 'created' field for timestamp
-                    description = image.get("description", "")
-                    # Filter snapshots that match our server name pattern or were created from this server
-                    if server.name in description or description.startswith(server.name):
-                        snapshot_id = str(image.get("id", ""))
-                        snapshot_name = description
-                        created_at_str = image.get("created", "")
-                        
-                        try:
-                            # Hetzner uses ISO format: "2024-12-02T13:32:34Z"
-                            created_at = datetime.datetime.fromisoformat(created_at_str.replace('Z', '+00:00')).astimezone(datetime.timezone.utc)
-                            snapshots.append({
-                                "id": snapshot_id,
-                                "name": snapshot_name,
-                                "created_at": created_at
-                            })
-                            self.logger.debug(f"  Found snapshot: {snapshot_name} (ID: {snapshot_id}, Created: {created_at.strftime('%Y-%m-%d %H:%M:%S')})")
-                        except (ValueError, KeyError) as e:
-                            self.logger.error(f"  Invalid date format for snapshot '{snapshot_name}': {created_at_str}")
+                images.extend(page_images)
                 
                 # Check if there are more pages
                 meta = data.get("meta", {})
@@ -885,36 +1288,32 @@ class SnapshotManager:
                 else:
                     break
                     
-            except requests.exceptions.RequestException as e:
-                error_msg = sanitize_log_output(str(e), server.api_token)
-                self.logger.error(f"[HETZNER] Failed to fetch snapshots: {error_msg}")
+            except (requests.exceptions.RequestException, ValueError) as e:  # ValueError: malformed JSON body
+                error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+                self.logger.error("[HETZNER] Failed to fetch snapshots: %s", error_msg)
                 break
             except Exception as e:
-                error_msg = sanitize_log_output(str(e), server.api_token)
-                self.logger.error(f"[HETZNER] Unexpected error fetching snapshots: {error_msg}")
+                error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+                self.logger.error("[HETZNER] Unexpected error fetching snapshots: %s", error_msg)
                 break
+        
+        return images
 
-        self.logger.info(f"Found {len(snapshots)} snapshot(s) for server '{server.name}'")
-        return snapshots
-
-    def identify_snapshots_to_delete(self, server: ServerConfig, snapshots: List[dict], retain: int) -> List[dict]:
-        snapshots.sort(key=lambda x: x['created_at'], reverse=True)
-        to_delete = snapshots[retain:]
+    def identify_snapshots_to_delete(self, server: ServerConfig, snapshots: List[SnapshotRecord], retain: int) -> List[SnapshotRecord]:
+        _, to_delete = partition_retain_delete(snapshots, retain)
         if to_delete:
             self.logger.info(f"Identified {len(to_delete)} snapshot(s) for deletion:")
             for snap in to_delete:
-                self.logger.info(f"  - {snap['name']} (ID: {snap['id']})")
+                self.logger.info("  - %s (ID: %s)", snap.name, snap.id)
         return to_delete
 
     def create_snapshot(self, server: ServerConfig) -> Optional[str]:
         """Create a snapshot for a server, routing to provider-specific method."""
-        if server.provider == "digitalocean":
-            return self.create_digitalocean_snapshot(server)
-        elif server.provider == "hetzner":
-            return self.create_hetzner_snapshot(server)
-        else:
+        handler = self._CREATE.get(server.provider)
+        if handler is None:
             self.logger.error(f"Unknown provider: {server.provider}")
             return None
+        return handler(self, server)
     
     def create_digitalocean_snapshot(self, server: ServerConfig) -> Optional[str]:
         """Create a snapshot for a DigitalOcean droplet using direct API call."""
@@ -926,10 +1325,7 @@ class SnapshotManager:
         # DigitalOcean API v2: POST /droplets/{id}/actions
         base_url = "https://api.digitalocean.com/v2"
         url = f"{base_url}/droplets/{server.id}/actions"
-        headers = {
-            "Authorization": f"Bearer {server.api_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _auth_headers(server.api_token)
         payload = {
             "type": "snapshot",
             "name": snapshot_name
@@ -937,10 +1333,10 @@ class SnapshotManager:
         
         try:
             self.logger.debug(f"[DIGITALOCEAN] Sending snapshot creation request")
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
+            response = self._session.post(url, headers=headers, json=payload, timeout=60)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             action = data.get("action", {})
             action_id = action.get("id")
             
@@ -960,31 +1356,38 @@ class SnapshotManager:
                 self.logger.error(f"  ✗ Failed to create snapshot: No action ID returned")
                 return None
                 
-        except requests.exceptions.RequestException as e:
-            error_msg = sanitize_log_output(str(e), server.api_token)
-            self.logger.error(f"  ✗ Failed to create snapshot: {error_msg}")
+        except (requests.exceptions.RequestException, ValueError) as e:  # ValueError: malformed JSON body
+            error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+            self.logger.error("  ✗ Failed to create snapshot: %s", error_msg)
             return None
         except Exception as e:
-            error_msg = sanitize_log_output(str(e), server.api_token)
-            self.logger.error(f"  ✗ Unexpected error creating snapshot: {error_msg}")
+            error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+            self.logger.error("  ✗ Unexpected error creating snapshot: %s", error_msg)
             return None
     
     def _wait_for_digitalocean_action(self, api_token: str, action_id: int, timeout: int = 300) -> str:
         """Wait for a DigitalOcean action to complete."""
         base_url = "https://api.digitalocean.com/v2"
         url = f"{base_url}/actions/{action_id}"
-        headers = {
-            "Authorization": f"Bearer {api_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _auth_headers(api_token)
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        start_time = time.monotonic()
+        delay = _POLL_INITIAL_DELAY
+        while time.monotonic() - start_time < timeout:
             try:
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self._session.get(url, headers=headers, timeout=30)
+                if response.status_code == 429:
+                    # Rate limited: back off at least as usual, longer if the API asks for it
+                    # (the session's Retry has already waited Retry-After once before giving up)
+                    retry_after = _retry_after_seconds(response)
+                    if retry_after is not None:
+                        wait_seconds = max(retry_after, delay)
+                        time.sleep(min(wait_seconds, max(0.0, timeout - (time.monotonic() - start_time))))
+                        delay = min(delay * _POLL_BACKOFF_FACTOR, _POLL_MAX_DELAY)
+                        continue
                 response.raise_for_status()
                 
-                data = response.json()
+                data = _json_loads(response.content)
                 action = data.get("action", {})
                 status = action.get("status", "unknown")
                 
@@ -992,16 +1395,14 @@ class SnapshotManager:
                     return "completed"
                 elif status == "errored":
                     return "errored"
-                elif status == "in-progress":
-                    time.sleep(5)  # Wait 5 seconds before checking again
-                    continue
-                else:
-                    time.sleep(5)
-                    continue
+                # "in-progress" or unknown status: check again later
                     
-            except requests.exceptions.RequestException:
-                time.sleep(5)
-                continue
+            except (requests.exceptions.RequestException, ValueError):  # ValueError: malformed JSON body
+                pass
+            
+            # Exponential backoff: short actions are noticed quickly, long ones don't hammer the API
+            time.sleep(delay)
+            delay = min(delay * _POLL_BACKOFF_FACTOR, _POLL_MAX_DELAY)
         
         return "timeout"
     
@@ -1015,10 +1416,7 @@ class SnapshotManager:
         # Hetzner Cloud API v1: POST /servers/{id}/actions/create_image
         base_url = "https://api.hetzner.cloud/v1"
         url = f"{base_url}/servers/{server.id}/actions/create_image"
-        headers = {
-            "Authorization": f"Bearer {server.api_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _auth_headers(server.api_token)
         payload = {
             "type": "snapshot",
             "description": snapshot_name
@@ -1026,10 +1424,10 @@ class SnapshotManager:
         
         try:
             self.logger.debug(f"[HETZNER] Sending snapshot creation request")
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
+            response = self._session.post(url, headers=headers, json=payload, timeout=60)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             action = data.get("action", {})
             image = data.get("image", {})
             
@@ -1049,31 +1447,38 @@ class SnapshotManager:
                 self.logger.error(f"  ✗ Failed to create snapshot: No action/image ID returned")
                 return None
                 
-        except requests.exceptions.RequestException as e:
-            error_msg = sanitize_log_output(str(e), server.api_token)
-            self.logger.error(f"  ✗ Failed to create snapshot: {error_msg}")
+        except (requests.exceptions.RequestException, ValueError) as e:  # ValueError: malformed JSON body
+            error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+            self.logger.error("  ✗ Failed to create snapshot: %s", error_msg)
             return None
         except Exception as e:
-            error_msg = sanitize_log_output(str(e), server.api_token)
-            self.logger.error(f"  ✗ Unexpected error creating snapshot: {error_msg}")
+            error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+            self.logger.error("  ✗ Unexpected error creating snapshot: %s", error_msg)
             return None
     
     def _wait_for_hetzner_action(self, api_token: str, action_id: int, timeout: int = 300) -> str:
         """Wait for a Hetzner Cloud action to complete."""
         base_url = "https://api.hetzner.cloud/v1"
         url = f"{base_url}/actions/{action_id}"
-        headers = {
-            "Authorization": f"Bearer {api_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _auth_headers(api_token)
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        start_time = time.monotonic()
+        delay = _POLL_INITIAL_DELAY
+        while time.monotonic() - start_time < timeout:
             try:
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self._session.get(url, headers=headers, timeout=30)
+                if response.status_code == 429:
+                    # Rate limited: back off at least as usual, longer if the API asks for it
+                    # (the session's Retry has already waited Retry-After once before giving up)
+                    retry_after = _retry_after_seconds(response)
+                    if retry_after is not None:
+                        wait_seconds = max(retry_after, delay)
+                        time.sleep(min(wait_seconds, max(0.0, timeout - (time.monotonic() - start_time))))
+                        delay = min(delay * _POLL_BACKOFF_FACTOR, _POLL_MAX_DELAY)
+                        continue
                 response.raise_for_status()
                 
-                data = response.json()
+                data = _json_loads(response.content)
                 action = data.get("action", {})
                 status = action.get("status", "unknown")
                 
@@ -1081,131 +1486,117 @@ class SnapshotManager:
                     return "success"
                 elif status == "error":
                     return "error"
-                elif status == "running":
-                    time.sleep(5)  # Wait 5 seconds before checking again
-                    continue
-                else:
-                    time.sleep(5)
-                    continue
+                # "running" or unknown status: check again later
                     
-            except requests.exceptions.RequestException:
-                time.sleep(5)
-                continue
+            except (requests.exceptions.RequestException, ValueError):  # ValueError: malformed JSON body
+                pass
+            
+            # Exponential backoff: short actions are noticed quickly, long ones don't hammer the API
+            time.sleep(delay)
+            delay = min(delay * _POLL_BACKOFF_FACTOR, _POLL_MAX_DELAY)
         
         return "timeout"
 
-    def delete_snapshots(self, server: ServerConfig, snapshots: List[dict]):
-        """Delete snapshots for a server, routing to provider-specific method."""
-        if server.provider == "digitalocean":
-            self.delete_digitalocean_snapshots(server, snapshots)
-        elif server.provider == "hetzner":
-            self.delete_hetzner_snapshots(server, snapshots)
-        else:
+    def delete_snapshots(self, server: ServerConfig, snapshots: List[SnapshotRecord]) -> int:
+        """Delete snapshots for a server, routing to provider-specific method. Returns the number removed."""
+        handler = self._DELETE.get(server.provider)
+        if handler is None:
             self.logger.error(f"Unknown provider: {server.provider}")
+            return 0
+        return handler(self, server, snapshots)
     
-    def delete_digitalocean_snapshots(self, server: ServerConfig, snapshots: List[dict]):
+    def delete_digitalocean_snapshots(self, server: ServerConfig, snapshots: List[SnapshotRecord]) -> int:
         """Delete snapshots for a DigitalOcean droplet using direct API call."""
         if not snapshots:
-            return
+            return 0
         self.logger.info(f"Deleting {len(snapshots)} snapshot(s) for droplet '{server.name}':")
         
         # DigitalOcean API v2: DELETE /snapshots/{id}
         base_url = "https://api.digitalocean.com/v2"
-        headers = {
-            "Authorization": f"Bearer {server.api_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _auth_headers(server.api_token)
         
-        for idx, snap in enumerate(snapshots, 1):
-            self.logger.info(f"  [{idx}/{len(snapshots)}] Deleting: {snap['name']} (ID: {snap['id']})")
-            self.logger.debug(f"  Initiating deletion of snapshot ID: {snap['id']}")
-            
-            url = f"{base_url}/snapshots/{snap['id']}"
-            
-            try:
-                response = requests.delete(url, headers=headers, timeout=30)
-                
-                if response.status_code == 204:
-                    self.logger.info(f"    ✓ Deleted successfully")
-                    self.logger.debug(f"    Deletion confirmed for snapshot ID: {snap['id']}")
-                elif response.status_code == 404:
-                    self.logger.warning(f"    Snapshot not found (likely already deleted)")
-                else:
-                    error_msg = sanitize_log_output(response.text[:200], server.api_token)
-                    self.logger.error(f"    ✗ Failed to delete snapshot (status {response.status_code}): {error_msg}")
-                    
-            except requests.exceptions.RequestException as e:
-                error_msg = sanitize_log_output(str(e), server.api_token)
-                self.logger.error(f"    ✗ Failed to delete snapshot: {error_msg}")
-            except Exception as e:
-                error_msg = sanitize_log_output(str(e), server.api_token)
-                self.logger.error(f"    ✗ Unexpected error deleting snapshot: {error_msg}")
+        url_template = base_url + "/snapshots/{}"
+        return self._delete_all(server, snapshots, url_template, headers)
     
-    def delete_hetzner_snapshots(self, server: ServerConfig, snapshots: List[dict]):
+    def delete_hetzner_snapshots(self, server: ServerConfig, snapshots: List[SnapshotRecord]) -> int:
         """Delete snapshots for a Hetzner Cloud server using direct API call."""
         if not snapshots:
-            return
+            return 0
         self.logger.info(f"Deleting {len(snapshots)} snapshot(s) for server '{server.name}':")
         
         # Hetzner Cloud API v1: DELETE /images/{id}
         base_url = "https://api.hetzner.cloud/v1"
-        headers = {
-            "Authorization": f"Bearer {server.api_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _auth_headers(server.api_token)
         
-        for idx, snap in enumerate(snapshots, 1):
-            self.logger.info(f"  [{idx}/{len(snapshots)}] Deleting: {snap['name']} (ID: {snap['id']})")
-            self.logger.debug(f"  Initiating deletion of snapshot ID: {snap['id']}")
-            
-            url = f"{base_url}/images/{snap['id']}"
+        url_template = base_url + "/images/{}"
+        return self._delete_all(server, snapshots, url_template, headers)
+
+    # Provider dispatch tables for get_snapshots/create_snapshot/delete_snapshots
+    # (a new provider only needs its three methods registered here)
+    _GET = {"digitalocean": get_digitalocean_snapshots, "hetzner": get_hetzner_snapshots}
+    _CREATE = {"digitalocean": create_digitalocean_snapshot, "hetzner": create_hetzner_snapshot}
+    _DELETE = {"digitalocean": delete_digitalocean_snapshots, "hetzner": delete_hetzner_snapshots}
+
+    def _delete_one(self, url: str, headers) -> tuple:
+        """
+        Issue a single snapshot DELETE (runs in a worker thread, does no logging).
+        Returns (status_code, error_detail, exception); unused fields are None.
+        """
+        try:
+            response = self._session.delete(url, headers=headers, timeout=30)
+        except Exception as e:
+            return None, None, e
+        if response.status_code in (204, 404):
+            return response.status_code, None, None
+        return response.status_code, _response_snippet(response), None
+
+    def _delete_all(self, server: ServerConfig, snapshots: List[SnapshotRecord], url_template: str, headers) -> int:
+        """
+        Delete snapshots with up to _MAX_PARALLEL_DELETES requests in flight.
+        Deletes are independent (an already deleted snapshot just returns 404); results
+        are logged from this thread in the original order, followed by one summary line.
+        Returns the number of snapshots that are gone (deleted or already missing).
+        """
+        removed = 0
+        failed = 0
+        with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_DELETES, len(snapshots)), thread_name_prefix='delete') as executor:
+            futures = [executor.submit(self._delete_one, url_template.format(snap.id), headers) for snap in snapshots]
             
-            try:
-                response = requests.delete(url, headers=headers, timeout=30)
-                
-                if response.status_code == 204:
-                    self.logger.info(f"    ✓ Deleted successfully")
-                    self.logger.debug(f"    Deletion confirmed for snapshot ID: {snap['id']}")
-                elif response.status_code == 404:
-                    self.logger.warning(f"    Snapshot not found (likely already deleted)")
+            total = len(snapshots)
+            for idx, (snap, future) in enumerate(zip(snapshots, futures), 1):
+                # One line per snapshot: "[idx/total] name (ID: id) -> outcome"
+                status_code, detail, e = future.result()
+                if e is not None:
+                    error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+                    if isinstance(e, requests.exceptions.RequestException):
+                        self.logger.error("  [%d/%d] %s (ID: %s) -> ✗ Failed to delete snapshot: %s", idx, total, snap.name, snap.id, error_msg)
+                    else:
+                        self.logger.error("  [%d/%d] %s (ID: %s) -> ✗ Unexpected error deleting snapshot: %s", idx, total, snap.name, snap.id, error_msg)
+                    failed += 1
+                elif status_code == 204:
+                    self.logger.info("  [%d/%d] %s (ID: %s) -> ✓ Deleted successfully", idx, total, snap.name, snap.id)
+                    removed += 1
+                elif status_code == 404:
+                    self.logger.warning("  [%d/%d] %s (ID: %s) -> Snapshot not found (likely already deleted)", idx, total, snap.name, snap.id)
+                    removed += 1
                 else:
-                    error_msg = sanitize_log_output(response.text[:200], server.api_token)
-                    self.logger.error(f"    ✗ Failed to delete snapshot (status {response.status_code}): {error_msg}")
-                    
-            except requests.exceptions.RequestException as e:
-                error_msg = sanitize_log_output(str(e), server.api_token)
-                self.logger.error(f"    ✗ Failed to delete snapshot: {error_msg}")
-            except Exception as e:
-                error_msg = sanitize_log_output(str(e), server.api_token)
-                self.logger.error(f"    ✗ Unexpected error deleting snapshot: {error_msg}")
+                    error_msg = _LazySanitize(sanitize_log_output, detail, server.api_token, server.masked_api_token)
+                    self.logger.error("  [%d/%d] %s (ID: %s) -> ✗ Failed to delete snapshot (status %s): %s", idx, total, snap.name, snap.id, status_code, error_msg)
+                    failed += 1
 
-    def replace_template_variables(self, template: str, server: ServerConfig, snapshot_name: str, 
-                                   total_snapshots: int, status: str, hostname: str, timestamp: str) -> str:
-        """Replace template variables in custom messages."""
-        replacements = {
-            '{script}': 'snapshots.py',
-            '{provider}': server.provider,
-            '{server_name}': server.name,
-            '{server_id}': server.id,
-            '{droplet_name}': server.name,  # Backward compatibility
-            '{droplet_id}': server.id,  # Backward compatibility
-            '{snapshot_name}': snapshot_name,
-            '{total_snapshots}': str(total_snapshots),
-            '{snapshot_info}': f'{total_snapshots} snapshots exist',
-            '{status}': status.upper(),
-            '{hostname}': hostname,
-            '{timestamp}': timestamp
-        }
-        result = template
-        for placeholder, value in replacements.items():
-            result = result.replace(placeholder, value)
-        return result
-    
-    def replace_template_variables_dict(self, template_dict: dict, server: ServerConfig, snapshot_name: str,
-                                       total_snapshots: int, status: str, hostname: str, timestamp: str) -> dict:
-        """Replace template variables in dictionary (for webhook payloads)."""
-        result = {}
-        replacements = {
+        if failed:
+            self.logger.warning("Deleted %d of %d snapshot(s) for '%s', %d failed", removed, total, server.name, failed)
+        else:
+            self.logger.info("Deleted %d of %d snapshot(s) for '%s'", removed, total, server.name)
+        return removed
+
+    def _template_replacements(self, server: ServerConfig, snapshot_name: str, total_snapshots: int,
+                               status: str, hostname: str, timestamp: str) -> Dict[str, str]:
+        """
+        Values for the template placeholders, keyed by placeholder (e.g. '{status}'; see _PLACEHOLDER_KEYS).
+        status is used as given (write_final_status passes it upper-case).
+        """
+        return {
             '{script}': 'snapshots.py',
             '{provider}': server.provider,
             '{server_name}': server.name,
@@ -1215,190 +1606,149 @@ class SnapshotManager:
             '{snapshot_name}': snapshot_name,
             '{total_snapshots}': str(total_snapshots),
             '{snapshot_info}': f'{total_snapshots} snapshots exist',
-            '{status}': status.upper(),
+            '{status}': status,
             '{hostname}': hostname,
             '{timestamp}': timestamp
         }
-        for key, value in template_dict.items():
-            if isinstance(value, str):
-                for placeholder, replacement in replacements.items():
-                    value = value.replace(placeholder, replacement)
-                result[key] = value
-            elif isinstance(value, dict):
-                result[key] = self.replace_template_variables_dict(value, server, snapshot_name, 
-                                                                   total_snapshots, status, hostname, timestamp)
-            elif isinstance(value, list):
-                result[key] = [
-                    self.replace_template_variables_dict(item, server, snapshot_name, total_snapshots, 
-                                                        status, hostname, timestamp) if isinstance(item, dict)
-                    else self.replace_template_variables(str(item), server, snapshot_name, total_snapshots,
-                                                        status, hostname, timestamp) if isinstance(item, str)
-                    else item
-                    for item in value
-                ]
-            else:
-                result[key] = value
-        return result
+
+    def _resolve_telegram(self, server: ServerConfig, status: str) -> Optional[Tuple[str, str, str, Optional[str]]]:
+        """
+        Telegram settings for a final status notification (status upper-case):
+        (bot_token, chat_id, api_url, message_template).
+        Returns None when Telegram is disabled or no credentials are available. message_template
+        is None when the default message format should be used.
+        """
+        # Only send if explicitly enabled (either per-server or global fallback)
+        # Don't send if global enabled is False, even if credentials exist
+        if not server.telegram_enabled:
+            self.logger.debug("[NOTIFICATIONS] Telegram notifications skipped (not enabled for server '%s')", server.name)
+            return None
+        if server.telegram_bot_token and server.telegram_chat_id:
+            self.logger.debug("[NOTIFICATIONS] Using Telegram credentials for server '%s'", server.name)
+            credentials = (server.telegram_bot_token, server.telegram_chat_id, server.telegram_api_url)
+        elif TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
+            # Telegram enabled but credentials missing - should have been handled in load_configs
+            # but check fallback one more time just in case
+            self.logger.debug("[NOTIFICATIONS] Using global Telegram credentials (fallback) for server '%s'", server.name)
+            credentials = (TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, TELEGRAM_API_URL)
+        else:
+            self.logger.debug("[NOTIFICATIONS] Telegram notifications skipped - no credentials available for server '%s'", server.name)
+            return None
+        
+        template = None
+        if status == "SUCCESS":
+            if server.telegram_message_success:
+                template = server.telegram_message_success
+                self.logger.debug("[NOTIFICATIONS] Using per-server custom success message template")
+            elif TELEGRAM_MESSAGE_SUCCESS:
+                template = TELEGRAM_MESSAGE_SUCCESS
+                self.logger.debug("[NOTIFICATIONS] Using fallback success message template from config")
+        elif status == "FAILURE":
+            if server.telegram_message_failure:
+                template = server.telegram_message_failure
+                self.logger.debug("[NOTIFICATIONS] Using per-server custom failure message template")
+            elif TELEGRAM_MESSAGE_FAILURE:
+                template = TELEGRAM_MESSAGE_FAILURE
+                self.logger.debug("[NOTIFICATIONS] Using fallback failure message template from config")
+        return credentials + (template,)
+
+    def _resolve_webhook_url(self, server: ServerConfig) -> Optional[str]:
+        """Webhook URL for a final status notification, or None when webhooks are disabled or unconfigured."""
+        # Only send if explicitly enabled (either per-server or global fallback)
+        # Don't send if global enabled is False, even if URL exists
+        if not server.webhook_enabled:
+            self.logger.debug("[NOTIFICATIONS] Webhook notifications skipped (not enabled for server '%s')", server.name)
+            return None
+        if server.webhook_url:
+            self.logger.debug("[NOTIFICATIONS] Using webhook URL for server '%s'", server.name)
+            return server.webhook_url
+        # Webhook enabled but URL missing - should have been handled in load_configs
+        # but check fallback one more time just in case
+        if WEBHOOK_URL:
+            self.logger.debug("[NOTIFICATIONS] Using global webhook URL (fallback) for server '%s'", server.name)
+            return WEBHOOK_URL
+        self.logger.debug("[NOTIFICATIONS] Webhook notifications skipped - no URL available for server '%s'", server.name)
+        return None
+
+    def _webhook_payload_template(self, server: ServerConfig, status: str) -> Optional[Tuple[dict, tuple]]:
+        """
+        Custom webhook payload template and its render plan for the upper-case status
+        (per-server or fallback), or None for the default payload (also used when the fallback
+        template is invalid; that is reported once in __init__).
+        """
+        if status == "SUCCESS":
+            if server.webhook_payload_success:
+                self.logger.debug("[NOTIFICATIONS] Using per-server custom success payload template")
+                return server.webhook_payload_success, server.webhook_payload_success_plan
+            if _WEBHOOK_PAYLOAD_SUCCESS_OBJ is not None:
+                self.logger.debug("[NOTIFICATIONS] Using fallback success payload template from config")
+                return _WEBHOOK_PAYLOAD_SUCCESS_OBJ, _WEBHOOK_PAYLOAD_SUCCESS_PLAN
+        elif status == "FAILURE":
+            if server.webhook_payload_failure:
+                self.logger.debug("[NOTIFICATIONS] Using per-server custom failure payload template")
+                return server.webhook_payload_failure, server.webhook_payload_failure_plan
+            if _WEBHOOK_PAYLOAD_FAILURE_OBJ is not None:
+                self.logger.debug("[NOTIFICATIONS] Using fallback failure payload template from config")
+                return _WEBHOOK_PAYLOAD_FAILURE_OBJ, _WEBHOOK_PAYLOAD_FAILURE_PLAN
+        return None
 
     def write_final_status(self, server: ServerConfig, snapshot_name: str, total_snapshots: int, status: str):
-        hostname = os.uname().nodename
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        final_status_message = f"FINAL_STATUS | snapshots.py | {server.provider} | {server.name} | {status.upper()} | {hostname} | {timestamp} | {snapshot_name} | {total_snapshots} snapshots exist"
-        self.logger.info(final_status_message)
+        hostname = self._hostname
+        timestamp = _ts()
+        status = status.upper()  # Templates, payloads and the log line all use the upper-case status
         
         # Create standardized notification data structure (used by both Telegram and webhook)
         notification_data = create_notification_data(
             script_name="snapshots.py",
             server_name=server.name,
             server_id=server.id,
-            status=status.upper(),
+            status=status,
             hostname=hostname,
             timestamp=timestamp,
             snapshot_name=snapshot_name,
             total_snapshots=total_snapshots,
             provider=server.provider
         )
+        # The final status line reuses the strings already in notification_data
+        self.logger.info(" | ".join((
+            "FINAL_STATUS", notification_data["script"], server.provider, server.name, status,
+            hostname, timestamp, snapshot_name, notification_data["snapshot_info"]
+        )))
+        # Placeholder values, built on first use and shared by the Telegram message and webhook payload
+        replacements = None
         
         # Send Telegram notification if enabled for this server
-        self.logger.debug(f"[NOTIFICATIONS] Checking Telegram notification configuration")
-        # Only send if explicitly enabled (either per-server or global fallback)
-        # Don't send if global enabled is False, even if credentials exist
-        if server.telegram_enabled:
-            if server.telegram_bot_token and server.telegram_chat_id:
-                self.logger.debug(f"[NOTIFICATIONS] Using Telegram credentials for server '{server.name}'")
-                # Use custom message if provided (per-server or fallback), otherwise use default format from data
-                custom_message = None
-                if status.upper() == "SUCCESS":
-                    if server.telegram_message_success:
-                        custom_message = self.replace_template_variables(
-                            server.telegram_message_success, server, snapshot_name, 
-                            total_snapshots, status, hostname, timestamp
-                        )
-                        self.logger.debug(f"[NOTIFICATIONS] Using per-server custom success message template")
-                    elif TELEGRAM_MESSAGE_SUCCESS:
-                        custom_message = self.replace_template_variables(
-                            TELEGRAM_MESSAGE_SUCCESS, server, snapshot_name, 
-                            total_snapshots, status, hostname, timestamp
-                        )
-                        self.logger.debug(f"[NOTIFICATIONS] Using fallback success message template from config")
-                elif status.upper() == "FAILURE":
-                    if server.telegram_message_failure:
-                        custom_message = self.replace_template_variables(
-                            server.telegram_message_failure, server, snapshot_name,
-                            total_snapshots, status, hostname, timestamp
-                        )
-                        self.logger.debug(f"[NOTIFICATIONS] Using per-server custom failure message template")
-                    elif TELEGRAM_MESSAGE_FAILURE:
-                        custom_message = self.replace_template_variables(
-                            TELEGRAM_MESSAGE_FAILURE, server, snapshot_name,
-                            total_snapshots, status, hostname, timestamp
-                        )
-                        self.logger.debug(f"[NOTIFICATIONS] Using fallback failure message template from config")
-                
-                send_telegram_notification(
-                    notification_data, 
-                    self.logger,
-                    bot_token=server.telegram_bot_token,
-                    chat_id=server.telegram_chat_id,
-                    custom_message=custom_message
-                )
-            else:
-                # Telegram enabled but credentials missing - should have been handled in load_configs
-                # but check fallback one more time just in case
-                if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
-                    self.logger.debug(f"[NOTIFICATIONS] Using global Telegram credentials (fallback) for server '{server.name}'")
-                    # Use custom message if provided (per-server or fallback), otherwise use default format from data
-                    custom_message = None
-                    if status.upper() == "SUCCESS":
-                        if server.telegram_message_success:
-                            custom_message = self.replace_template_variables(
-                                server.telegram_message_success, server, snapshot_name, 
-                                total_snapshots, status, hostname, timestamp
-                            )
-                            self.logger.debug(f"[NOTIFICATIONS] Using per-server custom success message template (fallback credentials)")
-                        elif TELEGRAM_MESSAGE_SUCCESS:
-                            custom_message = self.replace_template_variables(
-                                TELEGRAM_MESSAGE_SUCCESS, server, snapshot_name, 
-                                total_snapshots, status, hostname, timestamp
-                            )
-                            self.logger.debug(f"[NOTIFICATIONS] Using fallback success message template from config")
-                    elif status.upper() == "FAILURE":
-                        if server.telegram_message_failure:
-                            custom_message = self.replace_template_variables(
-                                server.telegram_message_failure, server, snapshot_name,
-                                total_snapshots, status, hostname, timestamp
-                            )
-                            self.logger.debug(f"[NOTIFICATIONS] Using per-server custom failure message template (fallback credentials)")
-                        elif TELEGRAM_MESSAGE_FAILURE:
-                            custom_message = self.replace_template_variables(
-                                TELEGRAM_MESSAGE_FAILURE, server, snapshot_name,
-                                total_snapshots, status, hostname, timestamp
-                            )
-                            self.logger.debug(f"[NOTIFICATIONS] Using fallback failure message template from config")
-                    
-                    send_telegram_notification(notification_data, self.logger, custom_message=custom_message)
-                else:
-                    self.logger.debug(f"[NOTIFICATIONS] Telegram notifications skipped - no credentials available for server '{server.name}'")
-        else:
-            self.logger.debug(f"[NOTIFICATIONS] Telegram notifications skipped (not enabled for server '{server.name}')")
+        self.logger.debug("[NOTIFICATIONS] Checking Telegram notification configuration")
+        telegram = self._resolve_telegram(server, status)
+        if telegram is not None:
+            bot_token, chat_id, api_url, template = telegram
+            # Use custom message if provided (per-server or fallback), otherwise use default format from data
+            custom_message = None
+            if template:
+                replacements = self._template_replacements(server, snapshot_name, total_snapshots, status, hostname, timestamp)
+                custom_message = _render_template(template, replacements)
+            self._notification_futures.append(_NOTIFY_POOL.submit(
+                send_telegram_notification,
+                notification_data,
+                self.logger,
+                bot_token=bot_token,
+                chat_id=chat_id,
+                custom_message=custom_message,
+                api_url=api_url
+            ))
         
         # Send webhook notification if enabled for this server
-        # Only send if explicitly enabled (either per-server or global fallback)
-        # Don't send if global enabled is False, even if URL exists
-        webhook_url_to_use = None
-        if server.webhook_enabled:
-            if server.webhook_url:
-                self.logger.debug(f"[NOTIFICATIONS] Using webhook URL for server '{server.name}'")
-                webhook_url_to_use = server.webhook_url
-            else:
-                # Webhook enabled but URL missing - should have been handled in load_configs
-                # but check fallback one more time just in case
-                if WEBHOOK_URL:
-                    self.logger.debug(f"[NOTIFICATIONS] Using global webhook URL (fallback) for server '{server.name}'")
-                    webhook_url_to_use = WEBHOOK_URL
-                else:
-                    self.logger.debug(f"[NOTIFICATIONS] Webhook notifications skipped - no URL available for server '{server.name}'")
-        else:
-            self.logger.debug(f"[NOTIFICATIONS] Webhook notifications skipped (not enabled for server '{server.name}')")
-        
+        webhook_url_to_use = self._resolve_webhook_url(server)
         if webhook_url_to_use:
-            self.logger.debug(f"[NOTIFICATIONS] Preparing webhook notification")
+            self.logger.debug("[NOTIFICATIONS] Preparing webhook notification")
             # Use custom payload if provided (per-server or fallback), otherwise use standardized data structure
             payload = None
-            if status.upper() == "SUCCESS":
-                if server.webhook_payload_success:
-                    payload = self.replace_template_variables_dict(
-                        server.webhook_payload_success.copy(), server, snapshot_name,
-                        total_snapshots, status, hostname, timestamp
-                    )
-                    self.logger.debug(f"[NOTIFICATIONS] Using per-server custom success payload template")
-                elif WEBHOOK_PAYLOAD_SUCCESS:
-                    try:
-                        fallback_payload = json.loads(WEBHOOK_PAYLOAD_SUCCESS)
-                        payload = self.replace_template_variables_dict(
-                            fallback_payload, server, snapshot_name,
-                            total_snapshots, status, hostname, timestamp
-                        )
-                        self.logger.debug(f"[NOTIFICATIONS] Using fallback success payload template from config")
-                    except json.JSONDecodeError as e:
-                        self.logger.warning(f"[NOTIFICATIONS] Invalid JSON in fallback success payload template: {e}. Using default.")
-            elif status.upper() == "FAILURE":
-                if server.webhook_payload_failure:
-                    payload = self.replace_template_variables_dict(
-                        server.webhook_payload_failure.copy(), server, snapshot_name,
-                        total_snapshots, status, hostname, timestamp
-                    )
-                    self.logger.debug(f"[NOTIFICATIONS] Using per-server custom failure payload template")
-                elif WEBHOOK_PAYLOAD_FAILURE:
-                    try:
-                        fallback_payload = json.loads(WEBHOOK_PAYLOAD_FAILURE)
-                        payload = self.replace_template_variables_dict(
-                            fallback_payload, server, snapshot_name,
-                            total_snapshots, status, hostname, timestamp
-                        )
-                        self.logger.debug(f"[NOTIFICATIONS] Using fallback failure payload template from config")
-                    except json.JSONDecodeError as e:
-                        self.logger.warning(f"[NOTIFICATIONS] Invalid JSON in fallback failure payload template: {e}. Using default.")
+            template = self._webhook_payload_template(server, status)
+            if template is not None:
+                template_dict, plan = template
+                if replacements is None:
+                    replacements = self._template_replacements(server, snapshot_name, total_snapshots, status, hostname, timestamp)
+                payload = _render_template_dict(template_dict, replacements, plan)
             
             # If no custom payload was used, use the standardized data structure
             if payload is None:
@@ -1412,21 +1762,42 @@ class SnapshotManager:
                     except (ValueError, TypeError):
                         pass  # Keep as string if conversion fails
             
-            # Ensure payload is JSON-serializable (n8n requirement)
+            # Ensure payload is JSON-serializable (n8n requirement); the serialized body is
+            # handed to the sender, so this is the only serialization pass
             try:
-                json.dumps(payload)
+                body = _webhook_body(payload)
             except (TypeError, ValueError) as e:
                 self.logger.error(f"[NOTIFICATIONS] Payload is not JSON-serializable: {e}")
                 payload = {str(k): str(v) for k, v in payload.items()}  # Fallback: convert all to strings
+                body = _webhook_body(payload)
             
-            send_webhook_notification(
+            self._notification_futures.append(_NOTIFY_POOL.submit(
+                send_webhook_notification,
                 self.logger,
                 webhook_url=webhook_url_to_use,
                 payload=payload,
+                body=body,
                 timeout=WEBHOOK_TIMEOUT,
                 retries=WEBHOOK_RETRIES,
                 base_delay=WEBHOOK_BASE_DELAY_BETWEEN_RETRIES
-            )
+            ))
+
+    def wait_for_notifications(self):
+        """Wait for all notifications dispatched in the background to complete."""
+        if not self._notification_futures:
+            return
+        self.logger.debug("[NOTIFICATIONS] Waiting for %s pending notification(s)", len(self._notification_futures))
+        for future in as_completed(self._notification_futures):
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.error("[NOTIFICATIONS] Unexpected error sending notification: %s", _LazySanitize(sanitize_log_output, str(e)))
+        self._notification_futures.clear()
+
+    def close(self):
+        """Release the manager's worker threads and pooled provider API connections."""
+        self._step_pool.shutdown(wait=True)
+        self._session.close()
 
     def manage_snapshots_for_server(self, server: ServerConfig):
         provider_label = server.provider.upper()
@@ -1434,8 +1805,7 @@ class SnapshotManager:
         self.logger.info(f"Managing {provider_label} server: {server.name} (ID: {server.id})")
         self.logger.info(f"  Configuration: Retain last {server.retain_last_snapshots} snapshot(s)")
         self.logger.info(f"  Snapshot naming: {server.name}-<timestamp>")
-        masked_token = server.api_token[:6] + '...' + server.api_token[-6:] if len(server.api_token) > 12 else '***'
-        self.logger.debug(f"  API token configured: Yes (masked: {masked_token})")
+        self.logger.debug("  API token configured: Yes (masked: %s)", server.masked_api_token)
         
         # Log notification settings
         # Note: server.telegram_enabled and server.webhook_enabled already reflect
@@ -1458,37 +1828,48 @@ class SnapshotManager:
         self.logger.info("-" * 80)
 
         # Retrieve existing snapshots
-        self.logger.debug(f"Step 1/5: Retrieving existing snapshots for server '{server.name}'")
+        self.logger.debug("Step 1/5: Retrieving existing snapshots for server '%s'", server.name)
         snapshots = self.get_snapshots(server)
-        self.logger.debug(f"Step 1/5: Completed - Found {len(snapshots)} existing snapshot(s)")
+        self.logger.debug("Step 1/5: Completed - Found %s existing snapshot(s)", len(snapshots))
 
         # Identify snapshots to delete based on retention policy
-        self.logger.debug(f"Step 2/5: Identifying snapshots to delete (retain: {server.retain_last_snapshots})")
+        self.logger.debug("Step 2/5: Identifying snapshots to delete (retain: %s)", server.retain_last_snapshots)
         to_delete = self.identify_snapshots_to_delete(server, snapshots, server.retain_last_snapshots)
-        self.logger.debug(f"Step 2/5: Completed - {len(to_delete)} snapshot(s) marked for deletion")
+        self.logger.debug("Step 2/5: Completed - %s snapshot(s) marked for deletion", len(to_delete))
+
+        # Delete old snapshots in the background while the new snapshot is created:
+        # the deletions don't depend on the creation, which mostly waits for the provider action
+        delete_future = None
+        deleted_count = 0
+        if to_delete:
+            self.logger.debug("Step 4/5: Deleting old snapshots (in parallel with snapshot creation)")
+            delete_future = self._step_pool.submit(self.delete_snapshots, server, to_delete)
 
         # Create a new snapshot
-        self.logger.debug(f"Step 3/5: Creating new snapshot for server '{server.name}'")
+        self.logger.debug("Step 3/5: Creating new snapshot for server '%s'", server.name)
         snapshot_name = self.create_snapshot(server)
         if snapshot_name:
-            self.logger.debug(f"Step 3/5: Completed - Snapshot '{snapshot_name}' created")
+            self.logger.debug("Step 3/5: Completed - Snapshot '%s' created", snapshot_name)
         else:
-            self.logger.debug(f"Step 3/5: Failed - Snapshot creation unsuccessful")
+            self.logger.debug("Step 3/5: Failed - Snapshot creation unsuccessful")
 
-        # Delete old snapshots
-        self.logger.debug(f"Step 4/5: Deleting old snapshots")
-        if to_delete:
-            self.delete_snapshots(server, to_delete)
-            self.logger.debug(f"Step 4/5: Completed - Deleted {len(to_delete)} snapshot(s)")
+        # Wait for the deletions before counting the remaining snapshots
+        if delete_future is not None:
+            deleted_count = delete_future.result()
+            self.logger.debug("Step 4/5: Completed - Deleted %s of %s snapshot(s)", deleted_count, len(to_delete))
         else:
             self.logger.info("No snapshots to delete (retention policy satisfied)")
-            self.logger.debug(f"Step 4/5: Skipped - No snapshots to delete")
+            self.logger.debug("Step 4/5: Skipped - No snapshots to delete")
 
-        # Re-fetch snapshots after creation and deletion to get the updated count
-        self.logger.debug(f"Step 5/5: Re-fetching snapshots to get final count")
-        updated_snapshots = self.get_snapshots(server)
-        total_snapshots = len(updated_snapshots)
-        self.logger.debug(f"Step 5/5: Completed - Final snapshot count: {total_snapshots}")
+        if self.verify:
+            # Re-fetch snapshots after creation and deletion to get the authoritative count
+            self.logger.debug("Step 5/5: Re-fetching snapshots to get final count")
+            total_snapshots = len(self.get_snapshots(server))
+        else:
+            # The listing from step 1 plus what this run created and removed gives the same count
+            # without another round of API requests
+            total_snapshots = len(snapshots) - deleted_count + (1 if snapshot_name else 0)
+        self.logger.debug("Step 5/5: Completed - Final snapshot count: %s", total_snapshots)
 
         # Write final status to the log
         if snapshot_name:
@@ -1502,33 +1883,90 @@ class SnapshotManager:
         self.logger.info("=" * 80)
         self.logger.info("")  # Empty line for visual separation
 
+    def _process_server(self, idx: int, server: ServerConfig) -> bool:
+        """Manage snapshots for one server. Returns False if an unexpected error occurred."""
+        self.logger.info(f"Processing server {idx + 1}/{len(self.servers)}")
+        try:
+            self.manage_snapshots_for_server(server)
+            return True
+        except Exception as e:
+            error_msg = _LazySanitize(sanitize_log_output, str(e), server.api_token, server.masked_api_token)
+            self.logger.error("An unexpected error occurred for %s server '%s': %s", server.provider, server.name, error_msg, exc_info=True)
+            return False
+
+    def _run_parallel(self, workers: int) -> Tuple[int, int]:
+        """
+        Process all servers with up to `workers` at once and return (success_count, failure_count).
+        With MAX_PARALLEL_PER_PROVIDER set, a server is only submitted once its provider has a free
+        slot, so a busy provider never holds a worker that a server of another provider could use.
+        """
+        per_provider = MAX_PARALLEL_PER_PROVIDER or workers
+        pending = list(enumerate(self.servers))  # Submitted in configuration order, as far as the limits allow
+        running = {}  # future -> provider
+        active = {}  # provider -> number of its servers in progress
+        success_count = 0
+        failure_count = 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='server') as executor:
+            while pending or running:
+                for item in list(pending):
+                    if len(running) >= workers:
+                        break
+                    provider = item[1].provider
+                    if active.get(provider, 0) < per_provider:
+                        pending.remove(item)
+                        active[provider] = active.get(provider, 0) + 1
+                        running[executor.submit(self._process_server, *item)] = provider
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    active[running.pop(future)] -= 1
+                    if future.result():
+                        success_count += 1
+                    else:
+                        failure_count += 1
+        return success_count, failure_count
+
+    def _process_all(self) -> Tuple[int, int]:
+        """Process all servers (in parallel or one after another) and return (success_count, failure_count)."""
+        success_count = 0
+        failure_count = 0
+        
+        workers = min(MAX_PARALLEL_SERVERS, len(self.servers))
+        if workers > 1:
+            # Servers are independent and the work is network-bound (API calls and action polling),
+            # so process several at once; no delay between servers is needed in this mode
+            self.logger.info(f"Processing {len(self.servers)} servers with up to {workers} in parallel")
+            if MAX_PARALLEL_PER_PROVIDER:
+                self.logger.info(f"At most {MAX_PARALLEL_PER_PROVIDER} servers per provider are processed at the same time")
+            success_count, failure_count = self._run_parallel(workers)
+        else:
+            for idx, server in enumerate(self.servers):
+                if self._process_server(idx, server):
+                    success_count += 1
+                    
+                    if idx < len(self.servers) - 1:
+                        self.logger.info(f"Waiting for {DELAY_BETWEEN_SERVERS} seconds before processing the next server...")
+                        time.sleep(DELAY_BETWEEN_SERVERS)
+                else:
+                    failure_count += 1
+        return success_count, failure_count
+
     def run(self):
         """Run snapshot management for all servers. Continue processing even if one fails."""
         self.logger.info("")
         self.logger.info("=" * 80)
         self.logger.info("SNAPSHOT MANAGEMENT SESSION STARTED")
-        self.logger.info(f"Timestamp: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self.logger.info(f"Hostname: {os.uname().nodename}")
+        self.logger.info(f"Timestamp: {_ts()}")
+        self.logger.info(f"Hostname: {self._hostname}")
         self.logger.info(f"Total servers configured: {len(self.servers)}")
         self.logger.info("=" * 80)
         self.logger.info("")
         
-        success_count = 0
-        failure_count = 0
-        
-        for idx, server in enumerate(self.servers):
-            self.logger.info(f"Processing server {idx + 1}/{len(self.servers)}")
-            try:
-                self.manage_snapshots_for_server(server)
-                success_count += 1
-                
-                if idx < len(self.servers) - 1:
-                    self.logger.info(f"Waiting for {DELAY_BETWEEN_SERVERS} seconds before processing the next server...")
-                    time.sleep(DELAY_BETWEEN_SERVERS)
-            except Exception as e:
-                failure_count += 1
-                error_msg = sanitize_log_output(str(e), server.api_token if hasattr(server, 'api_token') else None)
-                self.logger.error(f"An unexpected error occurred for {server.provider} server '{server.name}': {error_msg}", exc_info=True)
+        try:
+            success_count, failure_count = self._process_all()
+            # Notifications are sent in the background; make sure they are delivered before exiting
+            self.wait_for_notifications()
+        finally:
+            self.close()
         
         # Log summary
         self.logger.info("")
@@ -1536,20 +1974,25 @@ class SnapshotManager:
         self.logger.info(f"SUMMARY: {success_count} succeeded, {failure_count} failed out of {len(self.servers)} total")
         self.logger.info("=" * 80)
         
-        # Print summary to stderr (will appear in cronjob.log)
-        summary_msg = f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] SUMMARY: {success_count} succeeded, {failure_count} failed out of {len(self.servers)} total"
-        print(summary_msg, file=sys.stderr)
-        
-        # Exit with error code if all failed, or if any failed (for cron monitoring)
+        # Print summary to stderr (will appear in cronjob.log); the summary and the failure line
+        # (if any) are written together, so they stay adjacent even with other output around
+        timestamp = _ts()
+        stderr_lines = [f"[{timestamp}] SUMMARY: {success_count} succeeded, {failure_count} failed out of {len(self.servers)} total"]
+        exit_code = 0
         if failure_count > 0:
             if success_count == 0:
                 self.logger.error("All servers failed")
-                print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: All servers failed", file=sys.stderr)
-                sys.exit(1)
+                stderr_lines.append(f"[{timestamp}] ERROR: All servers failed")
+                exit_code = 1
             else:
                 self.logger.warning(f"Partial failure: {failure_count} server(s) failed")
-                print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: Partial failure: {failure_count} server(s) failed", file=sys.stderr)
-                sys.exit(2)  # Partial failure
+                stderr_lines.append(f"[{timestamp}] WARNING: Partial failure: {failure_count} server(s) failed")
+                exit_code = 2  # Partial failure
+        sys.stderr.write("\n".join(stderr_lines) + "\n")
+        
+        # Exit with error code if all failed, or if any failed (for cron monitoring)
+        if exit_code:
+            sys.exit(exit_code)
 
 def parse_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Manage snapshots for multiple DigitalOcean droplets and Hetzner Cloud servers.")
@@ -1563,6 +2006,11 @@ def parse_arguments() -> argparse.Namespace:
         action='store_true',
         help="Enable verbose logging to the console."
     )
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help="Re-fetch each server's snapshots at the end to report the final count from the provider API."
+    )
     return parser.parse_args()
 
 def acquire_lock():
@@ -1572,17 +2020,24 @@ def acquire_lock():
         if not os.path.exists(LOGS_DIR):
             os.makedirs(LOGS_DIR, exist_ok=True)
         
-        lock_fd = os.open(LOCK_FILE, os.O_CREAT | os.O_WRONLY | os.O_TRUNC)
+        # No O_TRUNC here: truncating before the lock is held would wipe the PID of a running
+        # instance. O_CLOEXEC keeps the lock from being inherited by any child process.
+        lock_fd = os.open(LOCK_FILE, os.O_CREAT | os.O_WRONLY | os.O_CLOEXEC, 0o644)
         try:
             fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-            # Write PID to lock file
-            os.write(lock_fd, str(os.getpid()).encode())
-            print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Lock acquired successfully (PID: {os.getpid()})", file=sys.stderr)
+            # Write PID to lock file (replacing whatever a previous run left behind)
+            pid = os.getpid()
+            os.ftruncate(lock_fd, 0)
+            os.pwrite(lock_fd, f"{pid}\n".encode(), 0)
+            print(f"[{_ts()}] Lock acquired successfully (PID: {pid})", file=sys.stderr)
             return lock_fd
         except BlockingIOError:
             os.close(lock_fd)
             print(f"ERROR: Another instance of snapshots.py is already running. Lock file: {LOCK_FILE}", file=sys.stderr)
             sys.exit(3)  # Exit code 3 for lock failure
+        except BaseException:
+            os.close(lock_fd)
+            raise
     except Exception as e:
         print(f"ERROR: Failed to acquire lock: {e}", file=sys.stderr)
         sys.exit(3)
@@ -1603,7 +2058,7 @@ def main():
     args = parse_arguments()
     
     # Print startup message to stderr (will appear in cronjob.log)
-    print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting snapshot management script...", file=sys.stderr)
+    print(f"[{_ts()}] Starting snapshot management script...", file=sys.stderr)
 
     # Ensure directories exist
     if not os.path.isdir(CONFIGS_DIR):
@@ -1619,27 +2074,32 @@ def main():
             config_files = args.configs
         else:
             # Get all .json files in the configs directory, sorted alphabetically
-            # Exclude macOS resource fork files (._*)
-            config_files = sorted(f for f in os.listdir(CONFIGS_DIR) 
-                                 if f.lower().endswith('.json') and not f.startswith('._'))
+            # Exclude macOS resource fork files (._*) and anything that isn't a regular file
+            # (scandir's DirEntry caches the file type, so this needs no extra stat per entry)
+            with os.scandir(CONFIGS_DIR) as entries:
+                config_files = sorted(entry.name for entry in entries
+                                      if entry.name.lower().endswith('.json') and not entry.name.startswith('._')
+                                      and entry.is_file())
             if not config_files:
                 print(f"WARNING: No '.json' configuration files found in the '{CONFIGS_DIR}' directory.", file=sys.stderr)
                 sys.exit(0)  # Exit successfully if no configs (might be intentional)
 
-        print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Found {len(config_files)} configuration file(s).", file=sys.stderr)
+        print(f"[{_ts()}] Found {len(config_files)} configuration file(s).", file=sys.stderr)
         
         # Initialize the SnapshotManager with the provided configuration files
-        manager = SnapshotManager(config_paths=config_files, verbose=args.verbose)
+        manager = SnapshotManager(config_paths=config_files, verbose=args.verbose, verify=args.verify)
         manager.run()
         
-        print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Script completed successfully.", file=sys.stderr)
+        print(f"[{_ts()}] Script completed successfully.", file=sys.stderr)
     except Exception as e:
-        print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Script failed with exception: {e}", file=sys.stderr)
+        print(f"[{_ts()}] ERROR: Script failed with exception: {e}", file=sys.stderr)
         raise
     finally:
         # Always release lock
         if lock_fd is not None:
             release_lock(lock_fd)
+        # Release the pooled notification connections (SnapshotManager.run has waited for the notifications)
+        _SESSION.close()
 
 if __name__ == "__main__":
     main()
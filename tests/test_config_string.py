@@ -0,0 +1,22 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import snapshots
+
+
+class DecodeConfigStringTest(unittest.TestCase):
+    def test_non_ascii_without_escapes_is_unchanged(self):
+        self.assertEqual(snapshots.decode_config_string('Größe ✅'), 'Größe ✅')
+
+    def test_non_ascii_with_escapes_is_kept(self):
+        self.assertEqual(snapshots.decode_config_string('Größe ✅\\nline'), 'Größe ✅\nline')
+
+    def test_escape_sequences(self):
+        self.assertEqual(snapshots.decode_config_string('a\\tb\\\\n\\x41\\u00e9\\q'), 'a\tb\\nAé\\q')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import os
+import random
+import re
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import snapshots
+
+# The token patterns the sanitizers used before the single-pass scanner
+LOG_TOKEN_RE = re.compile(r'\b([A-Za-z0-9]{20,})\b')
+TELEGRAM_TOKEN_RE = re.compile(r'\b([A-Za-z0-9_-]{20,})\b')
+
+# Token characters plus the separators and word characters that decide where a token ends
+ALPHABET = 'aZ09' * 6 + '_-' * 4 + ' .:/"=' + 'öß✅é' + '\n'
+
+
+def regex_mask(pattern, text):
+    return pattern.sub(lambda m: m.group(1)[:6] + '...' + m.group(1)[-6:], text)
+
+
+class TokenMaskingTest(unittest.TestCase):
+    def test_masking_matches_original_regex_on_random_input(self):
+        rng = random.Random(1234)
+        for _ in range(20000):
+            text = ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 80)))
+            self.assertEqual(snapshots._TOKEN_RE.sub(snapshots._mask_match, text),
+                             regex_mask(LOG_TOKEN_RE, text), repr(text))
+            self.assertEqual(snapshots._TELEGRAM_TOKEN_RE.sub(snapshots._mask_match, text),
+                             regex_mask(TELEGRAM_TOKEN_RE, text), repr(text))
+
+    def test_telegram_token_glued_to_non_ascii_word(self):
+        self.assertEqual(snapshots.sanitize_telegram_output('Größe-AAHdk3k4j5h6g7f8d9s0a1qwertyuiop'),
+                         'Größe-AAHdk...tyuiop')
+
+
+if __name__ == '__main__':
+    unittest.main()